@@ -1,6 +1,251 @@
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+
+from util.cache import Cache
+from util.logging import configure_logging
+from util.profiling import PROFILERS
+from util.runner import (
+    discover_days,
+    format_table,
+    parse_day,
+    run_days,
+    run_days_parallel,
+)
+
+
+def add_selection_arguments(parser: ArgumentParser):
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help="Days to run, as numbers or package names (default: all)",
+    )
+    parser.add_argument(
+        "--part",
+        type=int,
+        choices=[1, 2],
+        action="append",
+        help="Part to run, may be repeated (default: both)",
+    )
+    parser.add_argument(
+        "--engine",
+        help="Run parts with this alternative engine, e.g. numpy, where they have one",
+    )
+
+
+def build_parser():
+    parser = ArgumentParser(description="Advent of Code 2025 solutions")
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="Log level for the solutions (default: WARNING)",
+    )
+    parser.add_argument(
+        "--log-background",
+        action="store_true",
+        help="Write log records from a background thread, off the solver's path",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Run days and print a timing table")
+    add_selection_arguments(run)
+    run.add_argument(
+        "--input",
+        default="input",
+        help="'input', 'test', 'all' or a path to an input file (default: input)",
+    )
+    run.add_argument(
+        "--profile",
+        choices=list(PROFILERS),
+        help="Profile each part, writing a report per part and input under .profiles/",
+    )
+    run.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse answers from .cache/ when neither the input nor the source changed",
+    )
+    run.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="Size in MiB the cache is trimmed back to (default: 256)",
+    )
+    run.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run every day, part and input concurrently on a process pool",
+    )
+    run.add_argument(
+        "--workers",
+        type=int,
+        help="Process pool size for --parallel (default: CPU count)",
+    )
+    run.add_argument(
+        "--combined",
+        action="store_true",
+        help="Parse each input once and share it between the parts",
+    )
+    run.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the extra untimed run that measures peak memory",
+    )
+
+    bench = subparsers.add_parser(
+        "bench", help="Benchmark days against real and scaled inputs"
+    )
+    add_selection_arguments(bench)
+    bench.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1000],
+        help="Input sizes to run, as multiples of the real input (default: 1 10 100 1000)",
+    )
+    bench.add_argument(
+        "--repeats", type=int, default=5, help="Timed runs per input (default: 5)"
+    )
+    bench.add_argument(
+        "--budget",
+        type=float,
+        default=5.0,
+        help="Skip larger scales once a median exceeds this many seconds (default: 5)",
+    )
+    bench.add_argument(
+        "--import-budget",
+        type=float,
+        default=50,
+        help="Fail if importing a part takes longer than this many ms (default: 50)",
+    )
+    bench.add_argument(
+        "--output", type=Path, help="Where to write the JSON results"
+    )
+    bench.add_argument(
+        "--compare", type=Path, help="Earlier JSON results to compare against"
+    )
+
+    generate = subparsers.add_parser(
+        "generate", help="Write a seeded synthetic input for a day"
+    )
+    generate.add_argument("day", help="Day to generate input for")
+    generate.add_argument(
+        "--size",
+        type=int,
+        required=True,
+        help="Number of records, e.g. lines, ranges, problems or grid rows",
+    )
+    generate.add_argument(
+        "--width", type=int, help="Row width, for days with fixed-width rows"
+    )
+    generate.add_argument("--seed", type=int, help="Random seed (default: 2025)")
+    generate.add_argument(
+        "--output", "-o", type=Path, required=True, help="File to write to"
+    )
+
+    return parser
+
+
+def generate(parser: ArgumentParser, args):
+    from util.generate import DEFAULT_SEED, GENERATORS, generate_input
+
+    try:
+        day = parse_day(args.day)
+    except ValueError as e:
+        parser.error(str(e))
+    if day not in GENERATORS:
+        parser.error(f"There's no generator for day {day}")
+
+    seed = DEFAULT_SEED if args.seed is None else args.seed
+    generate_input(day, args.output, args.size, args.width, seed)
+
+
 def main():
-    print("Hello from 2025-advent-of-code!")
+    parser = build_parser()
+    args = parser.parse_args()
+    # Configure logging before any day is imported, so the solutions'
+    # own configure_logging calls don't take effect.
+    configure_logging(args.log_level, background=args.log_background)
+
+    if args.command == "generate":
+        return generate(parser, args)
+
+    all_days = discover_days()
+    if args.days:
+        try:
+            days = [all_days[parse_day(d)] for d in args.days]
+        except (KeyError, ValueError) as e:
+            parser.error(f"Unknown day: {e}")
+    else:
+        days = list(all_days.values())
+    parts = args.part or [1, 2]
+    cache = (
+        Cache(max_bytes=args.cache_size * 1024 * 1024)
+        if getattr(args, "cache", False)
+        else None
+    )
+
+    if args.command == "run" and args.parallel and args.combined:
+        parser.error("--combined can't be used with --parallel")
+    if args.command == "run" and args.combined and args.engine:
+        parser.error("--combined can't be used with --engine")
+
+    if args.command == "run" and args.parallel:
+        results, wall = run_days_parallel(
+            days,
+            parts,
+            args.input,
+            trace_memory=not args.no_memory,
+            workers=args.workers,
+            log_level=args.log_level,
+            profile_mode=args.profile,
+            cache=cache,
+            engine=args.engine,
+        )
+        serial = sum(r.wall for r in results)
+        print(format_table(results))
+        print(
+            f"\nParallel wall time {wall * 1000:.1f} ms against a serial sum of "
+            f"{serial * 1000:.1f} ms ({serial / wall:.2f}x)"
+        )
+
+    elif args.command == "run":
+        results = run_days(
+            days,
+            parts,
+            args.input,
+            trace_memory=not args.no_memory,
+            profile_mode=args.profile,
+            cache=cache,
+            combined=args.combined,
+            engine=args.engine,
+        )
+        print(format_table(results))
+
+    elif args.command == "bench":
+        # Only pay for the benchmarking imports when benchmarking
+        from util.benchmark import (
+            check_import_times,
+            format_imports,
+            format_results,
+            load_results,
+            run_benchmarks,
+            save_results,
+        )
+
+        imports = check_import_times(days, parts, args.import_budget / 1000)
+        results = run_benchmarks(
+            days, parts, args.scales, args.repeats, args.budget, args.engine
+        )
+        output = save_results(results, imports, args.output)
+        baseline = load_results(args.compare) if args.compare else None
+        print(format_imports(imports))
+        print()
+        print(format_results(results, baseline))
+        print(f"\nResults written to {output}")
+
+        if any(r.over_budget for r in imports):
+            return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
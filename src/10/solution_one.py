@@ -1,8 +1,6 @@
 import copy
-from dataclasses import dataclass
 from functools import reduce
 from logging import getLogger
-from operator import add
 import operator
 from pathlib import Path
 import re
@@ -10,8 +8,7 @@ from util.input import read_input
 from util.logging import configure_logging
 
 
-configure_logging("DEBUG")
-logger = getLogger()
+logger = getLogger(__name__)
 
 INPUT_REGEX = r"\[([.#]+)\] ((\([0-9,]*\) )*)\{([0-9,]*)\}"
 
@@ -91,6 +88,28 @@ def analyse_rref(aug_m: list[list[int]]):
     return gen_solution
 
 
+def parse_puzzle(puzzle_input: str):
+    parsed = re.match(INPUT_REGEX, puzzle_input)
+    gs = parsed.groups()
+
+    target = list(0 if x == "." else 1 for x in gs[0])
+
+    buttons = []
+    for b in gs[1].strip().split(" "):
+        parsed_button = set(
+            int(x) for x in re.sub(r"[\(\)]", "", b).split(",") if x != ""
+        )
+        button = list(1 if _ in parsed_button else 0 for _ in range(len(target)))
+        buttons.append(button)
+
+    joltages = tuple(int(x) for x in gs[3].split(","))
+    return target, buttons, joltages
+
+
+def parse(input_path: Path | str):
+    return [parse_puzzle(line) for line in read_input(input_path)]
+
+
 class Machine:
     # Puzzle properties
     target: list[int]
@@ -100,26 +119,12 @@ class Machine:
     # Solution state tracking
     num_presses: int
 
-    def parse_puzzle(self, puzzle_input: str):
-        parsed = re.match(INPUT_REGEX, puzzle_input)
-        gs = parsed.groups()
-
-        self.target = list(0 if x == "." else 1 for x in gs[0])
-
-        self.buttons = []
-        for b in gs[1].strip().split(" "):
-            parsed_button = set(
-                int(x) for x in re.sub(r"[\(\)]", "", b).split(",") if x != ""
-            )
-            button = list(
-                1 if _ in parsed_button else 0 for _ in range(len(self.target))
-            )
-            self.buttons.append(button)
-
-        self.joltages = tuple(int(x) for x in gs[3].split(","))
-
-    def __init__(self, puzzle_input: str):
-        self.parse_puzzle(puzzle_input)
+    def __init__(
+        self, target: list[int], buttons: list[list[int]], joltages: list[int]
+    ):
+        self.target = target
+        self.buttons = buttons
+        self.joltages = joltages
         self.solution = None
 
     def solve(self):
@@ -129,7 +134,7 @@ class Machine:
 
         free_dims = len(gen_solution) - 1
 
-        logger.debug(f"There are {2 ** free_dims} solutions to compute and analyse")
+        logger.debug("There are %s solutions to compute and analyse", 2**free_dims)
 
         solution_weights = []
         for i in range(2**free_dims):
@@ -153,14 +158,8 @@ class Machine:
         return self.num_presses
 
 
-def main():
-    line_generator = read_input(Path(__file__).parent / "input.txt")
-    # line_generator = read_input(Path(__file__).parent / "test_input.txt")
-    machines: list[Machine] = []
-
-    for line in line_generator:
-        m = Machine(line)
-        machines.append(m)
+def solve(puzzles: list[tuple[list[int], list[list[int]], list[int]]]):
+    machines: list[Machine] = [Machine(*puzzle) for puzzle in puzzles]
 
     for idx, machine in enumerate(machines):
         machine.solve()
@@ -170,20 +169,13 @@ def main():
         [m.num_presses for m in machines if m.num_presses is not None],
     )
     logger.info(f"The answer is: {answer}")
+    return answer
 
 
-if __name__ == "__main__":
-    # import cProfile, pstats, io
-    # from pstats import SortKey
-
-    # pr = cProfile.Profile()
-    # pr.enable()
-    # main()
-    # pr.disable()
-    # s = io.StringIO()
-    # sortby = SortKey.CUMULATIVE
-    # ps = pstats.Stats(pr, stream=s).sort_stats(sortby)
-    # ps.print_stats()
-    # logger.info(s.getvalue())
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
+
+if __name__ == "__main__":
+    configure_logging("DEBUG")
     main()
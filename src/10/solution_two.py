@@ -1,25 +1,28 @@
 import copy
-from dataclasses import dataclass
-from fractions import Fraction
 from functools import reduce
-from itertools import combinations, product
+from itertools import product
 from logging import getLogger
-from math import ceil, floor, isclose
-from operator import add
+from math import ceil, floor
 import operator
 from pathlib import Path
-import re
-from util.input import read_input
+from typing import TYPE_CHECKING
 from util.logging import configure_logging
+from util.modules import import_day_module
 
+if TYPE_CHECKING:
+    from fractions import Fraction
 
-configure_logging("DEBUG")
-logger = getLogger()
 
-INPUT_REGEX = r"\[([.#]+)\] ((\([0-9,]*\) )*)\{([0-9,]*)\}"
+logger = getLogger(__name__)
+
+# Machines are read the same way for both parts
+parse = import_day_module("10.solution_one").parse
 
 
 def get_rref(m: list[list[int]]):
+    # fractions pulls in decimal, so only import it once we need it
+    from fractions import Fraction
+
     matrix = copy.deepcopy(m)
     pivot_row = 0
     pivot_col = 0
@@ -110,6 +113,8 @@ def make_int_range(low, high):
 
 
 def find_min_solution(gen_solution: list[list[int | Fraction]]):
+    from fractions import Fraction
+
     particular = gen_solution[0]
     frees = gen_solution[1:]
 
@@ -163,26 +168,12 @@ class Machine:
     num_presses: int
     num_frees: int
 
-    def parse_puzzle(self, puzzle_input: str):
-        parsed = re.match(INPUT_REGEX, puzzle_input)
-        gs = parsed.groups()
-
-        self.target = list(0 if x == "." else 1 for x in gs[0])
-
-        self.buttons = []
-        for b in gs[1].strip().split(" "):
-            parsed_button = set(
-                int(x) for x in re.sub(r"[\(\)]", "", b).split(",") if x != ""
-            )
-            button = list(
-                1 if _ in parsed_button else 0 for _ in range(len(self.target))
-            )
-            self.buttons.append(button)
-
-        self.joltages = tuple(int(x) for x in gs[3].split(","))
-
-    def __init__(self, puzzle_input: str):
-        self.parse_puzzle(puzzle_input)
+    def __init__(
+        self, target: list[int], buttons: list[list[int]], joltages: list[int]
+    ):
+        self.target = target
+        self.buttons = buttons
+        self.joltages = joltages
         self.solution = None
         self.num_presses = None
 
@@ -199,14 +190,8 @@ class Machine:
         return self.num_presses
 
 
-def main():
-    line_generator = read_input(Path(__file__).parent / "input.txt")
-    # line_generator = read_input(Path(__file__).parent / "test_input.txt")
-    machines: list[Machine] = []
-
-    for line in line_generator:
-        m = Machine(line)
-        machines.append(m)
+def solve(puzzles: list[tuple[list[int], list[list[int]], list[int]]]):
+    machines: list[Machine] = [Machine(*puzzle) for puzzle in puzzles]
 
     for machine in machines:
         machine.solve()
@@ -217,20 +202,13 @@ def main():
         [m.num_presses for m in machines if m.num_presses is not None],
     )
     logger.info(f"The answer is: {answer}")
+    return answer
 
 
-if __name__ == "__main__":
-    # import cProfile, pstats, io
-    # from pstats import SortKey
-
-    # pr = cProfile.Profile()
-    # pr.enable()
-    # main()
-    # pr.disable()
-    # s = io.StringIO()
-    # sortby = SortKey.CUMULATIVE
-    # ps = pstats.Stats(pr, stream=s).sort_stats(sortby)
-    # ps.print_stats()
-    # logger.info(s.getvalue())
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
+
+if __name__ == "__main__":
+    configure_logging("DEBUG")
     main()
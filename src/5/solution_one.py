@@ -4,8 +4,7 @@ from util.input import read_input
 from util.logging import configure_logging
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
 def optimise_ranges(ranges: list[tuple[int, int]]):
@@ -48,18 +47,16 @@ def parse_range(line: str):
 
 def parse_id(ranges, id):
     l, h = next(((l, h) for l, h in ranges.items() if (l <= id <= h)), (None, None))
-    logger.info(f"ID {id} in range {l}-{h}")
+    logger.debug("ID %s in range %s-%s", id, l, h)
     if l is not None:
         return 1
     else:
         return 0
 
 
-def main():
+def parse(input_path: Path | str):
     ranges_from_input = []
-    parse_mode = "ranges"
-    handlers = {"ranges": parse_range, "ids": parse_id}
-    line_generator = read_input(Path(__file__).parent / "input.txt")
+    line_generator = read_input(input_path)
     for line in line_generator:
         if line.strip() == "":
             break
@@ -68,20 +65,31 @@ def main():
 
     reduced_ranges = optimise_ranges(ranges_from_input)
 
-    count = 0
-    of = 0
     ids = []
     for line in line_generator:
         ids.append(int(line.strip()))
     ids = sorted(ids)
 
+    return reduced_ranges, ids
+
+
+def solve(puzzle: tuple[dict[int, int], list[int]]):
+    reduced_ranges, ids = puzzle
+    count = 0
+    of = 0
     for id in ids:
         count += parse_id(ranges=reduced_ranges, id=id)
         of += 1
 
     # logger.info(fresh_id_ranges)
     logger.info(f"There are {count} fresh ingredients, of a total {of} ingredients.")
+    return count
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
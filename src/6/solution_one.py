@@ -6,13 +6,18 @@ from util.input import read_input
 from util.logging import configure_logging
 
 
-configure_logging("DEBUG")
-logger = getLogger()
+logger = getLogger(__name__)
 
 
-def main():
+def parse(input_path: Path | str):
+    # Keep the lines as they are, spacing and all. Part two reads the
+    # worksheet column by column, so the alignment matters there
+    return list(read_input(input_path))
+
+
+def solve(worksheet_lines: list[str]):
     puzzle_matrix = []
-    for line in read_input(Path(__file__).parent / "input.txt"):
+    for line in worksheet_lines:
         nums = [x.strip() for x in line.strip().split(" ") if x.strip() != ""]
         puzzle_matrix.append(nums)
 
@@ -27,7 +32,13 @@ def main():
         sum += result
 
     logger.info(f"The checksum for the worksheet is {sum}")
+    return sum
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging("DEBUG")
     main()
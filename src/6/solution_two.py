@@ -3,12 +3,13 @@ from logging import getLogger
 import operator
 from pathlib import Path
 import re
-from util.input import read_input
 from util.logging import configure_logging
+from util.modules import import_day_module
 
 
-configure_logging("DEBUG")
-logger = getLogger()
+logger = getLogger(__name__)
+
+parse = import_day_module("6.solution_one").parse
 
 
 def get_next_space(line: str):
@@ -66,18 +67,20 @@ def solve_puzzle(lines: list[str]):
     return reduce(op, nums)
 
 
-def main():
-    worksheet_lines = []
-    for line in read_input(Path(__file__).parent / "input.txt"):
-        worksheet_lines.append(line)
-
+def solve(worksheet_lines: list[str]):
     puzzle_cols = trim_puzzles(worksheet_lines)
     sum = 0
     for col in puzzle_cols:
         sum += solve_puzzle(col)
 
     logger.info(f"The checksum for the worksheet is {sum}")
+    return sum
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging("DEBUG")
     main()
@@ -0,0 +1,40 @@
+"""
+Day seven part one on bit-packed rows. The beams are one int with a bit per
+column, and so is each row's splitters, so a row of the manifold is a few
+bitwise operations however many beams are going through it. Part two needs
+a count of timelines per column, which doesn't fit in a bit, so it stays as
+it is.
+"""
+
+from logging import getLogger
+from pathlib import Path
+
+from util.bitgrid import BitGrid
+
+logger = getLogger(__name__)
+
+
+def parse(input_path: Path | str) -> tuple[int, BitGrid]:
+    """
+    The starting beam and the splitters below it
+    """
+    logger.info(f"Packing {input_path}")
+    with open(input_path, "rb") as f:
+        lines = f.readlines()
+
+    start = BitGrid.from_lines(lines[:1], "S")
+    splitters = BitGrid.from_lines(lines[1:], "^")
+    if splitters.rows and splitters.width != start.width:
+        raise ValueError(f"The first row is {start.width} wide, not {splitters.width}")
+    return start.rows[0], splitters
+
+
+def count_splits(beams: int, splitters: BitGrid) -> int:
+    mask = splitters.mask
+    splits = 0
+    for row in splitters.rows:
+        hit = beams & row
+        splits += hit.bit_count()
+        beams = (beams & ~hit | hit << 1 | hit >> 1) & mask
+
+    return splits
@@ -2,18 +2,22 @@ from logging import getLogger
 from pathlib import Path
 from util.input import read_input
 from util.logging import configure_logging
+from util.modules import engine, import_day_module
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
-def main():
+def parse(input_path: Path | str):
+    return list(read_input(input_path))
+
+
+def solve(manifold: list[str]):
     # Keep track of the beams
     beams = set()
     splits = 0
 
-    line_generator = read_input(Path(__file__).parent / "input.txt")
+    line_generator = iter(manifold)
     start = next(line_generator).strip()
     beams.add(start.index("S"))
 
@@ -32,7 +36,26 @@ def main():
                 splits += 1
 
     logger.info(f"There are a total of {splits} splits.")
+    return splits
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
+
+@engine("7.bits")
+def main_bits(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    bits = import_day_module("7.bits")
+
+    splits = bits.count_splits(*bits.parse(input_path))
+    logger.info(f"There are a total of {splits} splits.")
+    return splits
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"bits": main_bits}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
@@ -1,18 +1,19 @@
 from logging import getLogger
 from pathlib import Path
-from util.input import read_input
 from util.logging import configure_logging
+from util.modules import import_day_module
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
+parse = import_day_module("7.solution_one").parse
 
-def main():
+
+def solve(manifold: list[str]):
     # Beams are no longer collapsing if they share an index
     timelines = 1
 
-    line_generator = read_input(Path(__file__).parent / "input.txt")
+    line_generator = iter(manifold)
     start = next(line_generator).strip()
     beams = {idx: 0 for idx in range(len(start))}
     beams[start.index("S")] += 1
@@ -34,7 +35,13 @@ def main():
                 beams[beam_idx + 1] += num
 
     logger.info(f"There are a total of {timelines} timelines.")
+    return timelines
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
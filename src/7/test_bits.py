@@ -0,0 +1,27 @@
+from pathlib import Path
+from random import Random
+
+from util.generate import tachyon_manifold
+from util.logging import configure_logging
+from util.modules import import_day_module
+
+bits = import_day_module("7.bits")
+solution_one = import_day_module("7.solution_one")
+
+
+def test_matches_beam_by_beam(tmp_path: Path):
+    path = tmp_path / "manifold.txt"
+    for seed in range(50):
+        with open(path, "w") as out:
+            tachyon_manifold(out, 40, Random(seed), width=30)
+
+        expected = solution_one.solve(solution_one.parse(path))
+        assert bits.count_splits(*bits.parse(path)) == expected
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_matches_beam_by_beam(Path(tmp))
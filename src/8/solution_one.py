@@ -7,8 +7,7 @@ from util.input import read_input
 from util.logging import configure_logging
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
 class Junction:
@@ -48,36 +47,49 @@ class Junction:
                 self.nearest_neighbour_id = j.id
 
 
-def main():
-    line_generator = read_input(Path(__file__).parent / "input.txt")
-    # line_generator = read_input(Path(__file__).parent / "test_input.txt")
+def parse(input_path: Path | str):
+    """
+    Read the junction box coords, along with every pair of boxes as
+    (distance, i, j) indexes into the coords, closest first.
+    """
+    logger.info("Reading coords and measuring connections")
+    coords = [
+        tuple(int(i) for i in line.strip().split(","))
+        for line in read_input(input_path)
+    ]
+    connections = sorted(
+        [
+            (
+                ((x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2) ** 0.5,
+                i_idx,
+                j_idx,
+            )
+            for i_idx, (x1, y1, z1) in enumerate(coords)
+            for j_idx, (x2, y2, z2) in enumerate(coords[i_idx + 1 :], i_idx + 1)
+        ],
+        key=(lambda c: c[0]),
+    )
+    return coords, connections
+
+
+def solve(puzzle: tuple[list[tuple[int, int, int]], list[tuple[float, int, int]]]):
+    coords, all_conns = puzzle
     j_boxes_by_id: dict[str, Junction] = {}
     circuits: dict[str, set[Junction]] = {}
 
-    logger.info("Reading coords and constructing circuits")
+    logger.info("Constructing circuits")
 
-    for line in line_generator:
-        x, y, z = (int(i) for i in line.strip().split(","))
-        j = Junction(x, y, z)
+    all_j_boxes = [Junction(x, y, z) for x, y, z in coords]
+    for j in all_j_boxes:
         j_boxes_by_id[j.id] = j
 
     logger.info("Connecting the closest ten...")
     total_circuits = len(j_boxes_by_id.keys())
     connections_made = 0
 
-    all_j_boxes = list(j_boxes_by_id.values())
-    all_conns = sorted(
-        [
-            {"distance": i.distance_from(j), "from": i, "to": j}
-            for i_idx, i in enumerate(all_j_boxes)
-            for j in all_j_boxes[i_idx + 1 :]
-        ],
-        key=(lambda j: j["distance"]),
-    )
-
-    for conn in all_conns[:1000]:
-        j = conn["from"]
-        nnb = conn["to"]
+    for _, i_idx, j_idx in all_conns[:1000]:
+        j = all_j_boxes[i_idx]
+        nnb = all_j_boxes[j_idx]
 
         if j.circuit is None and nnb.circuit is None:
             # Both are un-attached. We create a new circuit
@@ -119,7 +131,13 @@ def main():
     answer = reduce(operator.mul, circuits_by_length)
     # assert answer == 40
     logger.info(answer)
+    return answer
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
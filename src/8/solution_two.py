@@ -2,62 +2,26 @@ from functools import reduce
 from logging import getLogger
 import operator
 from pathlib import Path
-from uuid import uuid4
-from util.input import read_input
 from util.logging import configure_logging
+from util.modules import import_day_module
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
+parse = import_day_module("8.solution_one").parse
+Junction = import_day_module("8.solution_one").Junction
 
-class Junction:
-    id: str
-    nearest_neighbour_id: str | None
-    nearest_neighbour_distance: int | None
 
-    circuit: str | None
-
-    x: int
-    y: int
-    z: int
-
-    def __init__(self, x: int, y: int, z: int):
-        self.id = str(uuid4())[:6]
-        self.nearest_neighbour_id = None
-        self.nearest_neighbour_distance = None
-        self.circuit = self.id
-
-        self.x = x
-        self.y = y
-        self.z = z
-
-    def distance_from(self, j: Junction):
-        return ((self.x - j.x) ** 2 + (self.y - j.y) ** 2 + (self.z - j.z) ** 2) ** 0.5
-
-    def get_nearest_unconnected_neighbour(self, js: list[Junction]):
-        for j in js:
-            if j.id == self.id or (
-                self.circuit is not None and j.circuit == self.circuit
-            ):
-                continue
-
-            d = self.distance_from(j)
-            if self.nearest_neighbour_id is None or d < self.nearest_neighbour_distance:
-                self.nearest_neighbour_distance = d
-                self.nearest_neighbour_id = j.id
-
-
-def main():
-    line_generator = read_input(Path(__file__).parent / "input.txt")
-    # line_generator = read_input(Path(__file__).parent / "test_input.txt")
+def solve(puzzle: tuple[list[tuple[int, int, int]], list[tuple[float, int, int]]]):
+    coords, all_conns = puzzle
     j_boxes_by_id: dict[str, Junction] = {}
 
-    logger.info("Reading coords and constructing circuits")
+    logger.info("Constructing circuits")
 
-    for line in line_generator:
-        x, y, z = (int(i) for i in line.strip().split(","))
-        j = Junction(x, y, z)
+    all_j_boxes = [Junction(x, y, z) for x, y, z in coords]
+    for j in all_j_boxes:
+        # Every box starts out on a circuit of its own
+        j.circuit = j.id
         j_boxes_by_id[j.id] = j
 
     circuits: dict[str, set[Junction]] = {
@@ -67,23 +31,11 @@ def main():
     total_circuits = len(j_boxes_by_id.keys())
     connections_made = 0
 
-    all_j_boxes = list(j_boxes_by_id.values())
-    all_conns = [
-        x
-        for x in sorted(
-            [
-                {"distance": i.distance_from(j), "from": i, "to": j}
-                for i in all_j_boxes
-                for j in all_j_boxes
-                if i.id != j.id
-            ],
-            key=(lambda j: j["distance"]),
-        )
-    ]
-
-    for conn in all_conns:
-        j = conn["from"]
-        nnb = conn["to"]
+    # Each pair only comes up once. Seeing it again the other way round
+    # would always find both boxes on the same circuit already
+    for _, i_idx, j_idx in all_conns:
+        j = all_j_boxes[i_idx]
+        nnb = all_j_boxes[j_idx]
 
         if j.circuit == nnb.circuit:
             # Both are attached to each other already, skip
@@ -137,7 +89,13 @@ def main():
 
     # assert answer == 40
     logger.info(answer)
+    return answer
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
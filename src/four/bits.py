@@ -0,0 +1,61 @@
+"""
+Day four on a bit-packed grid. Each row's accessible rolls come from the
+neighbour count planes of util.bitgrid, so a row is checked in a handful of
+big-int operations rather than cell by cell.
+"""
+
+from logging import getLogger
+from pathlib import Path
+
+from four.solution_one import MAX_NEIGHBOURS
+from util.bitgrid import BitGrid
+
+logger = getLogger(__name__)
+
+
+def parse(input_path: Path | str) -> BitGrid:
+    return BitGrid.from_file(input_path, "@")
+
+
+def accessible(grid: BitGrid, row_idx: int) -> int:
+    return grid.rows[row_idx] & grid.fewer_neighbours(row_idx, MAX_NEIGHBOURS)
+
+
+def count_accessible(grid: BitGrid) -> int:
+    return sum(accessible(grid, idx).bit_count() for idx in range(len(grid.rows)))
+
+
+def peel(grid: BitGrid, rows: range) -> tuple[int, set[int]]:
+    """
+    Remove accessible rolls from the given rows of the grid in place, round
+    after round, until none are left to remove. Rows outside the range still
+    count as neighbours but are left alone. Only rows next to a removal can
+    have changed, so each round after the first checks just those. Returns
+    how many rolls were removed and which rows they came from.
+    """
+    removed = 0
+    changed = set()
+    to_check = set(rows)
+    while to_check:
+        # Work out the whole round before removing anything
+        removals = {idx: accessible(grid, idx) for idx in to_check}
+        to_check = set()
+        for idx, removable in removals.items():
+            if not removable:
+                continue
+            removed += removable.bit_count()
+            grid.rows[idx] &= ~removable
+            changed.add(idx)
+            to_check.update(r for r in (idx - 1, idx, idx + 1) if r in rows)
+
+    return removed, changed
+
+
+def count_removable(grid: BitGrid) -> int:
+    """
+    Remove every accessible roll, round after round, until none are left to
+    remove, counting them all
+    """
+    grid = BitGrid(list(grid.rows), grid.width)
+    removed, _ = peel(grid, range(len(grid.rows)))
+    return removed
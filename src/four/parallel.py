@@ -0,0 +1,135 @@
+"""
+Day four part two spread over worker processes. The grid lives in shared
+memory and is cut into a band of rows per worker. Each worker holds its own
+band packed, removes a round's worth of rolls from it, then publishes just
+its two edge rows and picks up its neighbours' ones before the next round,
+so a round costs every worker two rows of traffic however big the map is.
+"""
+
+from logging import getLogger
+from multiprocessing import Array, Barrier, Process
+from multiprocessing.shared_memory import SharedMemory
+import os
+from pathlib import Path
+
+from four import bits
+from four.tiled import band_bounds, read_band, write_row
+from util.bitgrid import BitGrid
+from util.input import grid_shape, map_input
+
+logger = getLogger(__name__)
+
+
+def read_row(buffer, row: int, shape: tuple[int, int, int]) -> int:
+    _, cols, stride = shape
+    return BitGrid.from_lines([buffer[row * stride : row * stride + cols]], "@").rows[0]
+
+
+def peel_band(
+    shm_name: str,
+    shape: tuple[int, int, int],
+    worker_idx: int,
+    start: int,
+    end: int,
+    barrier,
+    round_counts,
+    totals,
+):
+    """
+    Remove rolls from rows [start, end) of the shared grid, a round at a
+    time in step with the other workers, until a round in which none of
+    them removed anything
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        band, owned = read_band(shm.buf, start, end, shape)
+        rows = shape[0]
+        to_check = set(owned)
+        removed = 0
+        while True:
+            removals = {idx: bits.accessible(band, idx) for idx in to_check}
+            to_check = set()
+            count = 0
+            for idx, removable in removals.items():
+                if not removable:
+                    continue
+                count += removable.bit_count()
+                band.rows[idx] &= ~removable
+                to_check.update(r for r in (idx - 1, idx, idx + 1) if r in owned)
+            removed += count
+
+            for idx in (owned[0], owned[-1]):
+                if removals.get(idx):
+                    write_row(shm.buf, start + idx - owned.start, band.rows[idx], shape)
+            round_counts[worker_idx] = count
+            barrier.wait()
+
+            finished = not any(round_counts)
+            # Only the edge rows next to a changed halo row can have changed
+            if start:
+                halo = read_row(shm.buf, start - 1, shape)
+                if halo != band.rows[0]:
+                    band.rows[0] = halo
+                    to_check.add(owned[0])
+            if end < rows:
+                halo = read_row(shm.buf, end, shape)
+                if halo != band.rows[-1]:
+                    band.rows[-1] = halo
+                    to_check.add(owned[-1])
+            # Nobody moves on to overwrite the counts or edges until everyone
+            # has read them
+            barrier.wait()
+            if finished:
+                break
+
+        totals[worker_idx] = removed
+    except BaseException:
+        # Don't leave the other workers waiting on this one forever
+        barrier.abort()
+        raise
+    finally:
+        shm.close()
+
+
+def count_removable(input_path: Path | str, workers: int | None = None) -> int:
+    workers = workers or os.cpu_count()
+    with map_input(input_path) as buffer:
+        rows, cols, stride = grid_shape(buffer)
+        bounds = band_bounds(rows, -(-rows // workers)) if rows else []
+        logger.info(f"Peeling {len(bounds)} bands on {len(bounds)} workers")
+        if len(bounds) <= 1:
+            return bits.count_removable(bits.parse(input_path))
+
+        # Shared rows drop their line endings, so the stride is just the width
+        shm = SharedMemory(create=True, size=rows * cols)
+        try:
+            for row in range(rows):
+                shm.buf[row * cols : (row + 1) * cols] = buffer[
+                    row * stride : row * stride + cols
+                ]
+            return _run_workers(shm, (rows, cols, cols), bounds)
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def _run_workers(shm: SharedMemory, shape, bounds: list[tuple[int, int]]) -> int:
+    barrier = Barrier(len(bounds))
+    round_counts = Array("q", len(bounds), lock=False)
+    totals = Array("q", len(bounds), lock=False)
+    processes = [
+        Process(
+            target=peel_band,
+            args=(shm.name, shape, idx, start, end, barrier, round_counts, totals),
+        )
+        for idx, (start, end) in enumerate(bounds)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    failed = [idx for idx, process in enumerate(processes) if process.exitcode]
+    if failed:
+        raise RuntimeError(f"Workers {failed} failed to peel their bands")
+    return sum(totals)
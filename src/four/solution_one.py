@@ -1,15 +1,21 @@
 from logging import getLogger
 from pathlib import Path
+from typing import Any, Callable
 from util.input import read_input
 from util.logging import configure_logging
+from util.modules import engine
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
+# A roll can be reached by forklift with fewer neighbours than this
+MAX_NEIGHBOURS = 4
 
-def parse_line(line: str):
-    return line.split("")
+
+def parse(input_path: Path | str):
+    return [
+        [x for x in line.strip()] for line in read_input(input_path) if line.strip()
+    ]
 
 
 def get_adjacent_tiles(matrix: list[list[str]], row: int, col: int):
@@ -26,12 +32,7 @@ def get_adjacent_tiles(matrix: list[list[str]], row: int, col: int):
     ]
 
 
-def main():
-    puzzle_matrix = []
-    for line in read_input(Path(__file__).parent / "input.txt"):
-        # for line in read_input(Path(__file__).parent / "test_input.txt"):
-        puzzle_matrix.append([x for x in line.strip()])
-
+def count_accessible(puzzle_matrix: list[list[str]]):
     blank_matrix = [
         [" " for x in range(len(puzzle_matrix[0]))] for x in range(len(puzzle_matrix))
     ]
@@ -43,12 +44,55 @@ def main():
                 continue
 
             adjacent_tiles = get_adjacent_tiles(puzzle_matrix, row_idx, col_idx)
-            if len([x for x in adjacent_tiles if x == "@"]) < 4:
+            if len([x for x in adjacent_tiles if x == "@"]) < MAX_NEIGHBOURS:
                 accessible_loo_rolls += 1
                 blank_matrix[row_idx][col_idx] = "x"
 
-    logger.info(f"There are {accessible_loo_rolls} rolls accessible via forklift.")
+    return accessible_loo_rolls
+
+
+def solve_with(count: Callable[[Any], int], parsed) -> int:
+    """
+    Count with any of the engines, given the input as that engine parses it
+    """
+    accessible_loo_rolls = count(parsed)
+    logger.info("There are %s rolls accessible via forklift.", accessible_loo_rolls)
+    return accessible_loo_rolls
+
+
+def solve(puzzle_matrix: list[list[str]]):
+    return solve_with(count_accessible, puzzle_matrix)
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
+
+@engine("four.vectorised")
+def main_numpy(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.vectorised import count_accessible, parse
+
+    return solve_with(count_accessible, parse(input_path))
+
+
+@engine("four.bits")
+def main_bits(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.bits import count_accessible, parse
+
+    return solve_with(count_accessible, parse(input_path))
+
+
+@engine("four.tiled")
+def main_tiled(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.tiled import count_accessible
+
+    return solve_with(count_accessible, input_path)
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"numpy": main_numpy, "bits": main_bits, "tiled": main_tiled}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
@@ -1,37 +1,18 @@
 from logging import getLogger
 from pathlib import Path
-from util.input import read_input
+from typing import Any, Callable
+from four.solution_one import MAX_NEIGHBOURS, get_adjacent_tiles, parse
 from util.logging import configure_logging
+from util.modules import engine
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
-def parse_line(line: str):
-    return line.split("")
-
-
-def get_adjacent_tiles(matrix: list[list[str]], row: int, col: int):
-    min_row = max(0, row - 1)
-    max_row = min(len(matrix), row + 2)
-    row_range = range(min_row, max_row)
-
-    min_col = max(0, col - 1)
-    max_col = min(len(matrix[0]), col + 2)
-    col_range = range(min_col, max_col)
-
-    return [
-        matrix[i][j] for i in row_range for j in col_range if (i != row or j != col)
-    ]
-
-
-def main():
-    puzzle_matrix = []
-    for line in read_input(Path(__file__).parent / "input.txt"):
-        # for line in read_input(Path(__file__).parent / "test_input.txt"):
-        puzzle_matrix.append([x for x in line.strip()])
-
+def count_removable(grid: list[list[str]]):
+    # Rolls are removed as we go, so work on a copy and leave the parsed grid
+    # as it was for anyone else using it
+    puzzle_matrix = [row.copy() for row in grid]
     accessible_loo_rolls = 0
     previous_iteration_loo_rolls = 0
 
@@ -43,7 +24,7 @@ def main():
                     continue
 
                 adjacent_tiles = get_adjacent_tiles(puzzle_matrix, row_idx, col_idx)
-                if len([x for x in adjacent_tiles if x == "@"]) < 4:
+                if len([x for x in adjacent_tiles if x == "@"]) < MAX_NEIGHBOURS:
                     accessible_loo_rolls += 1
                     removed_rolls.append((row_idx, col_idx))
 
@@ -56,10 +37,74 @@ def main():
             for row, col in removed_rolls:
                 puzzle_matrix[row][col] = "."
 
+    return accessible_loo_rolls
+
+
+def solve_with(count: Callable[[Any], int], parsed) -> int:
+    """
+    Count with any of the engines, given the input as that engine parses it
+    """
+    accessible_loo_rolls = count(parsed)
     logger.info(
-        f"There are {accessible_loo_rolls} rolls accessible via forklift, when iteratively removing rolls."
+        "There are %s rolls accessible via forklift, when iteratively removing rolls.",
+        accessible_loo_rolls,
     )
+    return accessible_loo_rolls
+
+
+def solve(grid: list[list[str]]):
+    return solve_with(count_removable, grid)
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
+
+@engine("four.vectorised")
+def main_numpy(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.vectorised import count_removable, parse
+
+    return solve_with(count_removable, parse(input_path))
+
+
+@engine("four.worklist")
+def main_worklist(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.worklist import count_removable
+
+    return solve_with(count_removable, parse(input_path))
+
+
+@engine("four.bits")
+def main_bits(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.bits import count_removable, parse
+
+    return solve_with(count_removable, parse(input_path))
+
+
+@engine("four.tiled")
+def main_tiled(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.tiled import count_removable
+
+    return solve_with(count_removable, input_path)
+
+
+@engine("four.parallel")
+def main_parallel(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from four.parallel import count_removable
+
+    return solve_with(count_removable, input_path)
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {
+    "numpy": main_numpy,
+    "worklist": main_worklist,
+    "bits": main_bits,
+    "tiled": main_tiled,
+    "parallel": main_parallel,
+}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
@@ -0,0 +1,41 @@
+from random import Random
+
+from four import solution_one, solution_two
+from four.bits import count_accessible, count_removable
+from util.bitgrid import BitGrid
+from util.logging import configure_logging
+
+
+def test_fewer_neighbours_matches_counting():
+    rng = Random(7)
+    for _ in range(100):
+        rows, cols = rng.randint(1, 9), rng.randint(1, 9)
+        lines = ["".join(rng.choices("@.", k=cols)) for _ in range(rows)]
+        grid = BitGrid.from_lines(lines, "@")
+        matrix = [list(line) for line in lines]
+        for row in range(rows):
+            for limit in [1, 2, 4, 8]:
+                fewer = grid.fewer_neighbours(row, limit)
+                for col in range(cols):
+                    count = solution_one.get_adjacent_tiles(matrix, row, col).count("@")
+                    # Column 0 is the top bit
+                    assert (fewer >> (cols - 1 - col) & 1) == (count < limit)
+
+
+def test_day_four_matches():
+    rng = Random(8)
+    for _ in range(30):
+        rows, cols = rng.randint(1, 15), rng.randint(1, 15)
+        lines = [
+            "".join(rng.choices("@.", weights=(3, 1), k=cols)) for _ in range(rows)
+        ]
+        grid = BitGrid.from_lines(lines, "@")
+        matrix = [list(line) for line in lines]
+        assert count_accessible(grid) == solution_one.solve(matrix)
+        assert count_removable(grid) == solution_two.solve(matrix)
+
+
+if __name__ == "__main__":
+    configure_logging("DEBUG")
+    test_fewer_neighbours_matches_counting()
+    test_day_four_matches()
@@ -0,0 +1,26 @@
+from pathlib import Path
+from random import Random
+
+from four import solution_two
+from four.parallel import count_removable
+from util.logging import configure_logging
+
+
+def test_bands_match_whole_grid(tmp_path: Path):
+    rng = Random(10)
+    lines = ["".join(rng.choices("@.", weights=(3, 1), k=19)) for _ in range(11)]
+    path = tmp_path / "rolls.txt"
+    path.write_bytes("\r\n".join(lines).encode())
+
+    expected = solution_two.solve([list(line) for line in lines])
+    # Down to bands of a single row, and more workers than rows
+    for workers in [1, 2, 4, 11, 20]:
+        assert count_removable(path, workers) == expected
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_bands_match_whole_grid(Path(tmp))
@@ -0,0 +1,35 @@
+from pathlib import Path
+from random import Random
+
+from four import solution_one, solution_two
+from four.tiled import count_accessible, count_removable
+from util.logging import configure_logging
+
+
+def test_bands_match_whole_grid(tmp_path: Path):
+    rng = Random(9)
+    lines = ["".join(rng.choices("@.", weights=(3, 1), k=23)) for _ in range(37)]
+    grid = [list(line) for line in lines]
+    # CRLF endings and no final newline shouldn't throw the rows out
+    path = tmp_path / "rolls.txt"
+    path.write_bytes("\r\n".join(lines).encode())
+
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    for band_rows in [1, 2, 5, 100]:
+        assert count_accessible(path, band_rows) == solution_one.solve(grid)
+        assert count_removable(path, band_rows, scratch) == solution_two.solve(grid)
+    # By default the scratch copy goes alongside the input, and is cleared up
+    assert count_removable(path, 5) == solution_two.solve(grid)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["rolls.txt", "scratch"]
+    assert not any(scratch.iterdir())
+    # The input itself is never written to
+    assert path.read_bytes() == "\r\n".join(lines).encode()
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_bands_match_whole_grid(Path(tmp))
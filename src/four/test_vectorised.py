@@ -0,0 +1,26 @@
+from pathlib import Path
+from random import Random
+
+from four import solution_one, solution_two
+from four.vectorised import count_accessible, count_removable, parse
+from util.generate import roll_grid
+from util.logging import configure_logging
+
+
+def test_matches_cell_by_cell(tmp_path: Path):
+    path = tmp_path / "rolls.txt"
+    with open(path, "w") as out:
+        roll_grid(out, 30, Random(5), width=45)
+
+    rolls = parse(path)
+    grid = solution_one.parse(path)
+    assert count_accessible(rolls) == solution_one.solve(grid)
+    assert count_removable(rolls) == solution_two.solve(grid)
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_matches_cell_by_cell(Path(tmp))
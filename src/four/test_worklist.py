@@ -0,0 +1,18 @@
+from random import Random
+
+from four import solution_two
+from four.worklist import count_removable
+from util.logging import configure_logging
+
+
+def test_matches_removing_in_rounds():
+    rng = Random(6)
+    for _ in range(50):
+        rows, cols = rng.randint(1, 12), rng.randint(1, 12)
+        grid = [rng.choices("@.", weights=(3, 1), k=cols) for _ in range(rows)]
+        assert count_removable(grid) == solution_two.solve(grid)
+
+
+if __name__ == "__main__":
+    configure_logging("DEBUG")
+    test_matches_removing_in_rounds()
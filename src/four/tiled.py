@@ -0,0 +1,124 @@
+"""
+Day four for maps too big to load. The grid is read from a memory-mapped
+file a band of rows at a time, along with a halo row either side so the
+band's edge rows can see all their neighbours, and only the band is ever
+unpacked. Part two removes rolls from a scratch copy of the file a band at
+a time, and goes back to a neighbouring band only if a removal on the edge
+they share could have freed up more of it.
+"""
+
+from logging import getLogger
+from mmap import ACCESS_WRITE, mmap
+from pathlib import Path
+import shutil
+from tempfile import TemporaryDirectory
+
+from four.bits import accessible, peel
+from util.bitgrid import BitGrid
+from util.input import grid_shape, map_input
+
+logger = getLogger(__name__)
+
+BAND_ROWS = 4096
+
+# Turns a row written out in binary back into the map's characters
+RENDER = bytes.maketrans(b"01", b".@")
+
+
+def read_band(buffer, start: int, end: int, shape: tuple[int, int, int]):
+    """
+    Pack rows [start, end) of the grid along with their halo rows. Returns
+    the band and the range of its rows that are [start, end).
+    """
+    rows, cols, stride = shape
+    first = max(0, start - 1)
+    last = min(rows, end + 1)
+    band = BitGrid.from_lines(
+        (buffer[row * stride : row * stride + cols] for row in range(first, last)),
+        "@",
+    )
+    return band, range(start - first, end - first)
+
+
+def write_row(buffer, row: int, packed: int, shape: tuple[int, int, int]):
+    _, cols, stride = shape
+    buffer[row * stride : row * stride + cols] = (
+        format(packed, f"0{cols}b").encode().translate(RENDER)
+    )
+
+
+def band_bounds(rows: int, band_rows: int) -> list[tuple[int, int]]:
+    return [
+        (start, min(rows, start + band_rows)) for start in range(0, rows, band_rows)
+    ]
+
+
+def count_accessible(input_path: Path | str, band_rows: int = BAND_ROWS) -> int:
+    accessible_loo_rolls = 0
+    with map_input(input_path) as buffer:
+        shape = grid_shape(buffer)
+        for start, end in band_bounds(shape[0], band_rows):
+            band, owned = read_band(buffer, start, end, shape)
+            accessible_loo_rolls += sum(
+                accessible(band, idx).bit_count() for idx in owned
+            )
+
+    return accessible_loo_rolls
+
+
+def count_removable(
+    input_path: Path | str,
+    band_rows: int = BAND_ROWS,
+    scratch_dir: Path | str | None = None,
+) -> int:
+    """
+    Remove every roll that is or becomes accessible, counting them. The
+    removals are written to a copy of the input, in a temporary directory
+    made under scratch_dir and removed again once the count is done. It
+    defaults to alongside the input, which is known to be on a disk with
+    room for it, rather than the system temporary directory, which is often
+    held in memory and would defeat the point.
+    """
+    scratch_dir = scratch_dir or Path(input_path).parent
+    with TemporaryDirectory(dir=scratch_dir, prefix=".scratch-") as tmp:
+        scratch = Path(tmp) / "rolls.txt"
+        shutil.copyfile(input_path, scratch)
+        if not scratch.stat().st_size:
+            return 0
+
+        with (
+            open(scratch, "r+b") as f,
+            mmap(f.fileno(), 0, access=ACCESS_WRITE) as buffer,
+        ):
+            return _peel_bands(buffer, band_rows)
+
+
+def _peel_bands(buffer, band_rows: int) -> int:
+    shape = grid_shape(buffer)
+    bounds = band_bounds(shape[0], band_rows)
+    removed = 0
+    dirty = bytearray(b"\x01" * len(bounds))
+    sweeps = 0
+    while any(dirty):
+        sweeps += 1
+        for band_idx, (start, end) in enumerate(bounds):
+            if not dirty[band_idx]:
+                continue
+            dirty[band_idx] = 0
+
+            band, owned = read_band(buffer, start, end, shape)
+            band_removed, changed = peel(band, owned)
+            if not band_removed:
+                continue
+            removed += band_removed
+            for idx in changed:
+                write_row(buffer, start + idx - owned.start, band.rows[idx], shape)
+
+            # The bands either side only see this one's edge rows
+            if owned[0] in changed and band_idx:
+                dirty[band_idx - 1] = 1
+            if owned[-1] in changed and band_idx + 1 < len(bounds):
+                dirty[band_idx + 1] = 1
+
+    logger.debug("Peeled %s bands in %s sweeps", len(bounds), sweeps)
+    return removed
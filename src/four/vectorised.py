@@ -0,0 +1,71 @@
+"""
+Day four over the whole grid at once. Rolls are a 2D boolean array, and
+every cell's neighbour count comes from a 3x3 box sum, done as a sum of
+three shifted rows followed by a sum of three shifted columns. Needs numpy,
+which is an optional dependency, so nothing imports this module until its
+engine is asked for.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from four.solution_one import MAX_NEIGHBOURS
+from util.input import grid_shape, map_input
+
+
+def parse(input_path: Path | str) -> np.ndarray:
+    """
+    Read the map straight from the input bytes into a boolean grid, True
+    where there's a roll
+    """
+    with map_input(input_path) as buffer:
+        rows, cols, stride = grid_shape(buffer)
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        rolls = np.zeros((rows, cols), dtype=bool)
+        # The last row may be missing its newline, in which case it's
+        # short of a full stride and goes in on its own
+        full = min(rows, len(data) // stride)
+        rows_data = data[: full * stride].reshape(full, stride)
+        rolls[:full] = rows_data[:, :cols] == ord("@")
+        if full < rows:
+            rolls[full] = data[full * stride : full * stride + cols] == ord("@")
+        # Let go of the views, so the mapping can be closed
+        del data, rows_data
+
+    return rolls
+
+
+def neighbour_counts(rolls: np.ndarray) -> np.ndarray:
+    """
+    How many of its eight neighbours each cell has rolls in
+    """
+    padded = np.pad(rolls, 1).astype(np.uint8)
+    across = padded[:, :-2] + padded[:, 1:-1] + padded[:, 2:]
+    box = across[:-2] + across[1:-1] + across[2:]
+    # The box counts the cell itself too
+    return box - rolls
+
+
+def accessible(rolls: np.ndarray) -> np.ndarray:
+    return rolls & (neighbour_counts(rolls) < MAX_NEIGHBOURS)
+
+
+def count_accessible(rolls: np.ndarray) -> int:
+    return int(np.count_nonzero(accessible(rolls)))
+
+
+def count_removable(rolls: np.ndarray) -> int:
+    """
+    Remove every accessible roll, round after round, until none are left to
+    remove, counting them all
+    """
+    rolls = rolls.copy()
+    removed = 0
+    while True:
+        removable = accessible(rolls)
+        count = int(np.count_nonzero(removable))
+        if not count:
+            return removed
+        removed += count
+        rolls &= ~removable
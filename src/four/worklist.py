@@ -0,0 +1,72 @@
+"""
+Day four part two without rescanning the grid. Neighbour counts are worked
+out once, then removing a roll only touches its eight neighbours, queueing
+any that it leaves accessible. Which rolls end up removed doesn't depend on
+the order they go in, so this peels off the same rolls as removing them a
+round at a time, with each roll visited a bounded number of times however
+many rounds the removals would have taken.
+"""
+
+from collections import deque
+from logging import getLogger
+
+from four.solution_one import MAX_NEIGHBOURS
+
+logger = getLogger(__name__)
+
+
+def pad_grid(grid: list[list[str]]) -> tuple[bytearray, int]:
+    """
+    Flatten the grid into one cell per byte, 1 for a roll, with a border of
+    empty floor all round so no neighbour is ever out of bounds. Returns the
+    cells and the padded row width.
+    """
+    if not grid:
+        return bytearray(), 0
+
+    width = len(grid[0]) + 2
+    cells = bytearray(width)
+    for row in grid:
+        cells.append(0)
+        cells.extend(char == "@" for char in row)
+        cells.append(0)
+    cells.extend(bytes(width))
+    return cells, width
+
+
+def count_removable(grid: list[list[str]]) -> int:
+    """
+    Remove every roll that is or becomes accessible, counting them
+    """
+    cells, width = pad_grid(grid)
+    offsets = [
+        row * width + col for row in (-1, 0, 1) for col in (-1, 0, 1) if row or col
+    ]
+
+    counts = bytearray(len(cells))
+    queue = deque()
+    for idx, cell in enumerate(cells):
+        if not cell:
+            continue
+        counts[idx] = sum(cells[idx + offset] for offset in offsets)
+        if counts[idx] < MAX_NEIGHBOURS:
+            queue.append(idx)
+    logger.debug("%s rolls accessible to begin with", len(queue))
+
+    # Rolls come off the grid as they're queued, so none is queued twice
+    for idx in queue:
+        cells[idx] = 0
+
+    removed = 0
+    while queue:
+        idx = queue.popleft()
+        removed += 1
+        for offset in offsets:
+            neighbour = idx + offset
+            if cells[neighbour]:
+                counts[neighbour] -= 1
+                if counts[neighbour] < MAX_NEIGHBOURS:
+                    cells[neighbour] = 0
+                    queue.append(neighbour)
+
+    return removed
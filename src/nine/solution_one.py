@@ -4,8 +4,7 @@ from util.input import read_input
 from util.logging import configure_logging
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
 def get_area(c1: tuple[int, int], c2: tuple[int, int]):
@@ -14,13 +13,16 @@ def get_area(c1: tuple[int, int], c2: tuple[int, int]):
     return delta_x * delta_y
 
 
-def main():
+def parse(input_path: Path | str):
     red_coords = []
-    line_generator = read_input(Path(__file__).parent / "input.txt")
-    # line_generator = read_input(Path(__file__).parent / "test_input.txt")
+    line_generator = read_input(input_path)
     for line in line_generator:
         red_coords.append(tuple(int(x) for x in line.strip().split(",")))
 
+    return red_coords
+
+
+def solve(red_coords: list[tuple[int, int]]):
     logger.info(red_coords)
 
     areas = [
@@ -33,7 +35,13 @@ def main():
     answer = sorted(areas)[-1]
 
     logger.info(f"The largest possible area is {answer}")
+    return answer
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
@@ -1,12 +1,11 @@
-from logging import getLogger
+from logging import DEBUG, getLogger
 from pathlib import Path
 from typing import TypedDict
-from util.input import read_input
+from nine.solution_one import parse
 from util.logging import configure_logging
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
 def get_area(c1: tuple[int, int], c2: tuple[int, int]):
@@ -44,10 +43,14 @@ def get_edge(c1: tuple[int, int], c2: tuple[int, int]) -> Edge:
     }
 
 
-def check_intersection(c1: tuple[int, int], c2: tuple[int, int], edge: Edge):
+def check_intersection(
+    c1: tuple[int, int], c2: tuple[int, int], edge: Edge, debug: bool = False
+):
     # Iterate through the edges and check for intersections
 
-    if logger.level == "DEBUG":
+    # This runs for every edge of every rectangle, so the caller checks the
+    # log level once and passes it in
+    if debug:
         edge_in_range = c1[edge["edge_axis"]] < edge["at"] < c2[edge["edge_axis"]]
         starts_in_shape = (
             c1[edge["span_axis"]] <= edge["span_from"] <= c2[edge["span_axis"]]
@@ -77,13 +80,7 @@ def check_intersection(c1: tuple[int, int], c2: tuple[int, int], edge: Edge):
     )
 
 
-def main():
-    red_coords = []
-    line_generator = read_input(Path(__file__).parent / "input.txt")
-    # line_generator = read_input(Path(__file__).parent / "test_input.txt")
-    for line in line_generator:
-        red_coords.append(tuple(int(x) for x in line.strip().split(",")))
-
+def solve(red_coords: list[tuple[int, int]]):
     edges = []
     prev_x, prev_y = red_coords[-1]
     for x, y in red_coords:
@@ -91,12 +88,14 @@ def main():
         edges.append(e)
         prev_x, prev_y = x, y
 
+    debug = logger.isEnabledFor(DEBUG)
+
     def check_intersections(c1, c2):
         zipped = list(zip(c1, c2))
         mins = tuple(min(x) for x in zipped)
         maxs = tuple(max(x) for x in zipped)
         for e in edges:
-            if check_intersection(mins, maxs, e) is True:
+            if check_intersection(mins, maxs, e, debug) is True:
                 return True
 
         return False
@@ -110,7 +109,13 @@ def main():
     answer = max(areas)
 
     logger.info(f"The largest possible area is {answer}")
+    return answer
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
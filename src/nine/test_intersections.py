@@ -1,13 +1,9 @@
 from json import dumps
 from logging import getLogger
-from util.input import read_input
+from nine.solution_two import check_intersection, get_edge
 from util.logging import configure_logging
 
-configure_logging("DEBUG")
-logger = getLogger()
-
-
-from nine.solution_two import check_intersection, Edge, get_edge
+logger = getLogger(__name__)
 
 test_rect = (
     (3, 5),
@@ -43,4 +39,5 @@ def main():
 
 
 if __name__ == "__main__":
+    configure_logging("DEBUG")
     main()
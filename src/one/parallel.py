@@ -0,0 +1,142 @@
+"""
+Day one as a map-reduce over byte ranges of the rotations file, for inputs
+too big to want to walk on one core.
+
+A chunk can't know where the dial points when it starts, but the dial only
+has HIGHEST_VALUE positions. So each chunk is summarised for every possible
+start at once. The summaries are combined in order, and each chunk's end
+position gives the start for the next.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from logging import getLogger
+import os
+from pathlib import Path
+
+from one.solution_one import HIGHEST_VALUE, STARTING_VALUE
+from util.input import map_input, split_records
+
+logger = getLogger(__name__)
+
+# Below this there's nothing to gain from starting processes
+MIN_CHUNK_BYTES = 1 << 20
+
+
+@dataclass
+class ChunkSummary:
+    # Net rotation over the chunk
+    net: int
+    # zeros[s] is how many times the dial lands on zero, starting from s
+    zeros: list[int]
+    # crossings[s] is how many times the dial passes or lands on zero,
+    # starting from s
+    crossings: list[int]
+
+
+def summarise_chunk(input_path: Path | str, start: int, end: int) -> ChunkSummary:
+    """
+    Summarise the rotations in bytes start to end of input_path, which
+    should begin and end on line boundaries.
+
+    Positions are tracked relative to the unknown start s, never wrapping.
+    The dial lands on zero whenever s + position is a multiple of
+    HIGHEST_VALUE, so counting positions by their remainder gives zeros for
+    every s. Passing zero is counted with floor division: turning right
+    from a to b passes b // 100 - a // 100 zeros, and turning left passes
+    (a - 1) // 100 - (b - 1) // 100. With s added, x // 100 only goes up
+    by one when x % 100 + s reaches 100, so counting the terms by their
+    remainder too gives crossings for every s.
+    """
+    position = 0
+    landed = [0] * HIGHEST_VALUE
+    passed = [0] * HIGHEST_VALUE
+    base = 0
+
+    with map_input(input_path) as buffer:
+        for record in split_records(buffer, start=start, end=end):
+            line = bytes(record).strip()
+            if not line:
+                continue
+            rotation = int(line[1:])
+            if line[:1] == b"L":
+                rotation = -rotation
+
+            previous, position = position, position + rotation
+            if rotation > 0:
+                high, low = position, previous
+            elif rotation < 0:
+                high, low = previous - 1, position - 1
+            else:
+                high = low = position
+            base += high // HIGHEST_VALUE - low // HIGHEST_VALUE
+            passed[high % HIGHEST_VALUE] += 1
+            passed[low % HIGHEST_VALUE] -= 1
+            landed[position % HIGHEST_VALUE] += 1
+
+    # Every term with remainder r gains one for starts s >= HIGHEST_VALUE - r
+    crossings = []
+    extra = 0
+    for s in range(HIGHEST_VALUE):
+        if s:
+            extra += passed[HIGHEST_VALUE - s]
+        crossings.append(base + extra)
+
+    zeros = [landed[-s % HIGHEST_VALUE] for s in range(HIGHEST_VALUE)]
+    return ChunkSummary(position, zeros, crossings)
+
+
+def combine(summaries: list[ChunkSummary], start: int = STARTING_VALUE):
+    """
+    Fold chunk summaries in file order, returning the answers to both
+    parts
+    """
+    position = start
+    zeros = crossings = 0
+    for summary in summaries:
+        zeros += summary.zeros[position]
+        crossings += summary.crossings[position]
+        position = (position + summary.net) % HIGHEST_VALUE
+
+    return zeros, crossings
+
+
+def chunk_bounds(
+    input_path: Path | str, chunks: int, min_bytes: int = MIN_CHUNK_BYTES
+) -> list[tuple[int, int]]:
+    """
+    Split a file into about chunks byte ranges of at least min_bytes, each
+    moved on to the start of the next line so no rotation is cut in two
+    """
+    size = os.path.getsize(input_path)
+    chunks = max(1, min(chunks, size // min_bytes))
+    bounds = [0]
+    with open(input_path, "rb") as f:
+        for idx in range(1, chunks):
+            f.seek(max(size * idx // chunks, bounds[-1]))
+            f.readline()
+            bounds.append(f.tell())
+    bounds.append(size)
+
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+
+def solve(input_path: Path | str, workers: int | None = None) -> tuple[int, int]:
+    workers = workers or os.cpu_count()
+    # A few chunks per worker, so one slow chunk doesn't hold up the rest
+    bounds = chunk_bounds(input_path, workers * 4)
+    logger.info(f"Summarising {len(bounds)} chunks on {workers} workers")
+
+    if len(bounds) <= 1 or workers == 1:
+        summaries = [summarise_chunk(input_path, lo, hi) for lo, hi in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(
+                pool.map(
+                    summarise_chunk,
+                    [input_path] * len(bounds),
+                    *zip(*bounds),
+                )
+            )
+
+    return combine(summaries)
@@ -1,19 +1,11 @@
-from config.logging import configure_logging
-
-configure_logging()
-
+from logging import DEBUG, getLogger
 from pathlib import Path
-from logging import getLogger
-
-logger = getLogger()
+from util.input import read_input
+from util.logging import configure_logging
+from util.modules import engine
 
 
-def read_input():
-    input_path = Path(__file__).parent / "input.txt"
-    logger.info(f"Using {input_path}")
-    with open(input_path) as f:
-        for line in f:
-            yield line
+logger = getLogger(__name__)
 
 
 STARTING_VALUE = 50
@@ -21,32 +13,80 @@ PASSWORD_VALUE = 0
 HIGHEST_VALUE = 100
 
 
-def handle_instruction(curr: int, instruction: str):
+def parse_instruction(instruction: str):
+    """
+    Turn a rotation like L68 into a signed step, negative to the left
+    """
     clean = instruction.strip()
     LR = clean[0]
     num = int(clean[1:])
-    result = curr
     if LR == "L":
-        result = result - num
+        return -num
     elif LR == "R":
-        result = result + num
+        return num
+
+    return 0
+
+
+def handle_instruction(curr: int, rotation: int):
+    return curr + rotation
 
-    return result
 
+def parse(input_path: Path | str):
+    return [parse_instruction(line) for line in read_input(input_path) if line.strip()]
 
-def main():
+
+def solve(rotations: list[int]):
     position = STARTING_VALUE
     password = 0
-    for line in read_input():
-        position = handle_instruction(position, line)
+    for rotation in rotations:
+        position = handle_instruction(position, rotation)
         position = position % HIGHEST_VALUE
 
-        logger.info(f"The dial is rotated {line.strip()} to point at {position}.")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("The dial is rotated %s to point at %s.", rotation, position)
         if position == 0:
             password += 1
 
     logger.info(f"Password: {password}")
+    return password
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
+
+@engine("one.vectorised")
+def main_numpy(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from one.vectorised import count_zeros, parse
+
+    password = count_zeros(parse(input_path))
+    logger.info(f"Password: {password}")
+    return password
+
+
+@engine("one.parallel")
+def main_parallel(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from one.parallel import solve
+
+    password = solve(input_path)[0]
+    logger.info(f"Password: {password}")
+    return password
+
+
+@engine("one.stream")
+def main_stream(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from one.stream import solve
+
+    password = solve(input_path).zeros
+    logger.info(f"Password: {password}")
+    return password
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"numpy": main_numpy, "parallel": main_parallel, "stream": main_stream}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
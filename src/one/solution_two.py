@@ -1,30 +1,27 @@
-from math import floor
-from config.logging import configure_logging
-
-configure_logging()
-
-from pathlib import Path
 from logging import getLogger
-
-logger = getLogger()
-
+from pathlib import Path
 from one.solution_one import (
     HIGHEST_VALUE,
     STARTING_VALUE,
     handle_instruction,
-    read_input,
+    parse,
 )
+from util.logging import configure_logging
+from util.modules import engine
 
 
-def main():
+logger = getLogger(__name__)
+
+
+def solve(rotations: list[int]):
     position = STARTING_VALUE
     password = 0
-    for line in read_input():
-        result = handle_instruction(position, line)
+    for rotation in rotations:
+        result = handle_instruction(position, rotation)
         bound_result = result % 100
 
         # Perform a more in-depth password calc
-        password_contribution = floor(abs(result) / 100)
+        password_contribution = abs(result) // HIGHEST_VALUE
 
         # Check if we have crossed 0
         if position != 0 and result <= 0:
@@ -34,14 +31,56 @@ def main():
         password += password_contribution
         if password_contribution > 1 or result == 0:
             logger.info(
-                f"Starting at {position}, we rotate {line.strip()} to point at {bound_result} ({result}) contributing {password_contribution}."
+                "Starting at %s, we rotate %s to point at %s (%s) contributing %s.",
+                position,
+                rotation,
+                bound_result,
+                result,
+                password_contribution,
             )
         # Not quite so important now, but the logic assumes we are between
         # 0 and 100 (e.g. crossing 0)
         position = bound_result
 
     logger.info(f"Password: {password}")
+    return password
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
+
+@engine("one.vectorised")
+def main_numpy(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from one.vectorised import count_zero_crossings, parse
+
+    password = count_zero_crossings(parse(input_path))
+    logger.info(f"Password: {password}")
+    return password
+
+
+@engine("one.parallel")
+def main_parallel(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from one.parallel import solve
+
+    password = solve(input_path)[1]
+    logger.info(f"Password: {password}")
+    return password
+
+
+@engine("one.stream")
+def main_stream(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from one.stream import solve
+
+    password = solve(input_path).crossings
+    logger.info(f"Password: {password}")
+    return password
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"numpy": main_numpy, "parallel": main_parallel, "stream": main_stream}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
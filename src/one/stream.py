@@ -0,0 +1,135 @@
+"""
+Day one over a feed of rotations with no end, e.g. a pipe. Rotations are
+read in buffered chunks and folded into a handful of counters as they
+arrive, so memory stays flat however long the feed runs, and the running
+passwords are printed as it goes.
+
+    tail -f rotations.log | python src/one/stream.py --every 100000
+"""
+
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+import sys
+from typing import BinaryIO, Iterator
+
+from one.solution_one import HIGHEST_VALUE, STARTING_VALUE
+from util.logging import configure_logging
+
+logger = getLogger(__name__)
+
+CHUNK_SIZE = 1 << 16
+
+
+@dataclass
+class Dial:
+    position: int = STARTING_VALUE
+    rotations: int = 0
+    # Times the dial has landed on zero, the part one password
+    zeros: int = 0
+    # Times the dial has passed or landed on zero, the part two password
+    crossings: int = 0
+
+    def turn(self, rotation: int):
+        if rotation >= 0:
+            self.crossings += (self.position + rotation) // HIGHEST_VALUE
+        else:
+            # Turning left is turning right from the mirrored position
+            mirrored = (HIGHEST_VALUE - self.position) % HIGHEST_VALUE
+            self.crossings += (mirrored - rotation) // HIGHEST_VALUE
+
+        self.position = (self.position + rotation) % HIGHEST_VALUE
+        self.rotations += 1
+        if self.position == 0:
+            self.zeros += 1
+
+    def turn_line(self, line: bytes):
+        line = line.strip()
+        if not line:
+            return
+        rotation = int(line[1:])
+        self.turn(-rotation if line[:1] == b"L" else rotation)
+
+
+def read_chunks(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield whatever the stream has ready, up to chunk_size bytes at a time,
+    rather than waiting for a full chunk from a slow feed
+    """
+    read = getattr(stream, "read1", stream.read)
+    while chunk := read(chunk_size):
+        yield chunk
+
+
+def follow(
+    stream: BinaryIO, every: int = 1_000_000, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Dial]:
+    """
+    Turn the dial for every rotation on the stream, yielding it after any
+    chunk that takes it past another multiple of every rotations, and once
+    more when the stream ends. Only the part of a line cut off at the end
+    of a chunk is held over to the next.
+    """
+    dial = Dial()
+    partial = b""
+    next_report = every
+    reported = None
+    for chunk in read_chunks(stream, chunk_size):
+        lines = (partial + chunk).split(b"\n")
+        partial = lines.pop()
+        for line in lines:
+            dial.turn_line(line)
+
+        if dial.rotations >= next_report:
+            next_report = (dial.rotations // every + 1) * every
+            reported = dial.rotations
+            yield dial
+
+    dial.turn_line(partial)
+    if dial.rotations != reported:
+        yield dial
+
+
+def solve(input_path: Path | str) -> Dial:
+    """
+    Follow a file to its end, holding no more than a chunk of it at once
+    """
+    with open(input_path, "rb") as stream:
+        for dial in follow(stream):
+            pass
+    return dial
+
+
+def main(argv: list[str] | None = None):
+    parser = ArgumentParser(description="Follow a feed of dial rotations")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="File to read rotations from, or - for stdin (default: -)",
+    )
+    parser.add_argument(
+        "--every",
+        type=int,
+        default=1_000_000,
+        help="Print the passwords every this many rotations (default: 1000000)",
+    )
+    args = parser.parse_args(argv)
+
+    stream = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    with stream:
+        for dial in follow(stream, args.every):
+            print(
+                f"After {dial.rotations} rotations: part one password "
+                f"{dial.zeros}, part two password {dial.crossings}",
+                flush=True,
+            )
+
+    logger.info(f"Passwords: {dial.zeros} and {dial.crossings}")
+    return dial.zeros, dial.crossings
+
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
@@ -0,0 +1,31 @@
+from pathlib import Path
+from random import Random
+
+from one import parallel, solution_one, solution_two
+from util.generate import rotations
+from util.logging import configure_logging
+
+
+def test_chunks_combine_to_reference(tmp_path: Path):
+    path = tmp_path / "rotations.txt"
+    with open(path, "w") as out:
+        rotations(out, 2000, Random(2))
+
+    # Cut the input into lots of small chunks, so they start all around the
+    # dial
+    bounds = parallel.chunk_bounds(path, 50, min_bytes=64)
+    summaries = [parallel.summarise_chunk(path, lo, hi) for lo, hi in bounds]
+
+    assert bounds[0][0] == 0 and bounds[-1][1] == path.stat().st_size
+    assert parallel.combine(summaries) == (
+        solution_one.main(path),
+        solution_two.main(path),
+    )
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_chunks_combine_to_reference(Path(tmp))
@@ -0,0 +1,36 @@
+from io import BytesIO
+from pathlib import Path
+from random import Random
+
+from one import solution_one, solution_two
+from one.stream import follow
+from util.generate import rotations
+from util.logging import configure_logging
+
+
+def test_stream_matches_reference(tmp_path: Path):
+    path = tmp_path / "rotations.txt"
+    with open(path, "w") as out:
+        rotations(out, 500, Random(11))
+    expected = (solution_one.main(path), solution_two.main(path))
+
+    # CRLF endings and no final newline, in chunks short enough that lines
+    # are cut all over the place
+    data = path.read_bytes().replace(b"\n", b"\r\n").rstrip()
+    for chunk_size in [1, 3, 7, 64]:
+        dials = [
+            (dial.rotations, dial.zeros, dial.crossings)
+            for dial in follow(BytesIO(data), every=100, chunk_size=chunk_size)
+        ]
+        assert dials[-1] == (500, *expected)
+        # A report at least every 100 rotations, and none repeated
+        assert [count for count, _, _ in dials] == sorted({c for c, _, _ in dials})
+        assert len(dials) >= 5
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_stream_matches_reference(Path(tmp))
@@ -0,0 +1,36 @@
+from pathlib import Path
+from random import Random
+
+from one import solution_one, solution_two
+from one.vectorised import count_zero_crossings, count_zeros, parse
+from util.generate import rotations
+from util.logging import configure_logging
+
+TEST_INPUT = Path(__file__).parent / "test_input.txt"
+
+
+def test_parse(tmp_path: Path):
+    path = tmp_path / "rotations.txt"
+    path.write_text("L68\r\nR5\n\nL1000\nR0")
+
+    assert parse(path).tolist() == [-68, 5, -1000, 0]
+
+
+def test_matches_reference(tmp_path: Path):
+    path = tmp_path / "rotations.txt"
+    with open(path, "w") as out:
+        rotations(out, 2000, Random(1))
+
+    for input_path in [TEST_INPUT, path]:
+        parsed = parse(input_path)
+        assert count_zeros(parsed) == solution_one.main(input_path)
+        assert count_zero_crossings(parsed) == solution_two.main(input_path)
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_parse(Path(tmp))
+        test_matches_reference(Path(tmp))
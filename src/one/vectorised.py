@@ -0,0 +1,75 @@
+"""
+Day one over whole arrays of rotations at once, rather than a line at a
+time. Needs numpy, which is an optional dependency, so nothing imports this
+module until its engine is asked for.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from one.solution_one import HIGHEST_VALUE, STARTING_VALUE
+
+
+def parse(input_path: Path | str) -> np.ndarray:
+    """
+    Read every rotation into one signed int64 array, negative to the left,
+    without splitting the file into Python strings.
+    """
+    data = np.fromfile(input_path, dtype=np.uint8)
+    if data.size and data[-1] != ord("\n"):
+        data = np.append(data, np.uint8(ord("\n")))
+
+    ends = np.flatnonzero(data == ord("\n"))
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    # Leave any \r out of the digits
+    ends -= data[np.maximum(ends - 1, 0)] == ord("\r")
+    # Blank lines carry no rotation
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+
+    # Build the numbers up a place at a time, from the units leftwards.
+    # That's one pass per digit of the longest rotation, each over every
+    # line at once.
+    lengths = ends - starts - 1
+    magnitudes = np.zeros(len(ends), dtype=np.int64)
+    place = 1
+    for k in range(1, int(lengths.max(initial=0)) + 1):
+        digits = data[ends - k] - np.uint8(ord("0"))
+        digits[lengths < k] = 0
+        magnitudes += digits * np.int64(place)
+        place *= 10
+
+    return np.where(data[starts] == ord("L"), -magnitudes, magnitudes)
+
+
+def positions(rotations: np.ndarray) -> np.ndarray:
+    """
+    Where the dial points after each rotation
+    """
+    return (STARTING_VALUE + np.cumsum(rotations)) % HIGHEST_VALUE
+
+
+def count_zeros(rotations: np.ndarray) -> int:
+    return int(np.count_nonzero(positions(rotations) == 0))
+
+
+def count_zero_crossings(rotations: np.ndarray) -> int:
+    """
+    Count every time the dial passes or lands on zero, in exact integer
+    arithmetic. From position p, turning right by d passes zero
+    (p + d) // 100 times. Turning left by n is the same as turning right
+    from the mirrored position (100 - p) % 100.
+    """
+    if rotations.size == 0:
+        return 0
+
+    before = np.concatenate(([STARTING_VALUE], positions(rotations)[:-1]))
+    crossings = np.where(
+        rotations >= 0,
+        (before + rotations) // HIGHEST_VALUE,
+        ((HIGHEST_VALUE - before) % HIGHEST_VALUE - rotations) // HIGHEST_VALUE,
+    )
+    return int(crossings.sum())
@@ -2,10 +2,10 @@ from logging import getLogger
 from pathlib import Path
 from util.input import read_input
 from util.logging import configure_logging
+from util.modules import engine
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
 def get_largest_jolt(bank: str):
@@ -16,14 +16,45 @@ def get_largest_jolt(bank: str):
     return int(str(max_tens) + str(max_units))
 
 
-def main():
+def parse(input_path: Path | str):
+    return [line.strip() for line in read_input(input_path) if line.strip()]
+
+
+def solve(banks: list[str]):
     joltage = 0
-    # for line in read_input(Path(__file__).parent / "test_input.txt"):
-    for line in read_input(Path(__file__).parent / "input.txt"):
-        joltage += get_largest_jolt(line)
+    for bank in banks:
+        joltage += get_largest_jolt(bank)
+
+    logger.info(f"Max joltage: {joltage}")
+    return joltage
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
 
+@engine("three.vectorised")
+def main_numpy(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from three.vectorised import parse, total_joltage
+
+    joltage = total_joltage(parse(input_path), 2)
     logger.info(f"Max joltage: {joltage}")
+    return joltage
+
+
+@engine("three.stream")
+def main_stream(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from three.stream import total_joltage
+
+    joltage = total_joltage(input_path, 2)
+    logger.info(f"Max joltage: {joltage}")
+    return joltage
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"numpy": main_numpy, "stream": main_stream}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
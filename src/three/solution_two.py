@@ -1,44 +1,79 @@
 from logging import getLogger
 from pathlib import Path
-from util.input import read_input
+from three.solution_one import parse
 from util.logging import configure_logging
+from util.modules import engine
 
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 NUM_TO_TURN_ON = 12
 
 
-def get_largest_jolt(bank: str):
-    bank_it = [int(n) for n in bank.strip()]
-    num = ""
-    current_search_idx = 0
-    for battery_idx in range(-11, 1):
-        search_list = (
-            bank_it[current_search_idx:battery_idx]
-            if battery_idx < 0
-            else bank_it[current_search_idx:]
+def get_largest_jolt(bank: str, num_to_turn_on: int = NUM_TO_TURN_ON) -> int:
+    """
+    Pick the num_to_turn_on batteries, in bank order, that make the largest
+    joltage, in a single pass. Each battery knocks any smaller ones off the
+    end of the picks, as long as there are enough batteries left behind it
+    to fill their places.
+    """
+    bank = bank.strip()
+    to_drop = len(bank) - num_to_turn_on
+    if to_drop < 0:
+        raise ValueError(
+            f"Can't turn on {num_to_turn_on} batteries in a bank of {len(bank)}"
         )
-        digit = max(search_list)
-        num += str(digit)
-        current_search_idx += 1 + bank_it[current_search_idx:].index(digit)
 
-    return int(num)
+    picked = []
+    for battery in bank:
+        while to_drop and picked and picked[-1] < battery:
+            picked.pop()
+            to_drop -= 1
+        picked.append(battery)
 
+    # Anything left to drop is the smallest tail
+    return int("".join(picked[:num_to_turn_on]))
 
-def main():
+
+def solve(banks: list[str], num_to_turn_on: int = NUM_TO_TURN_ON):
     joltage = 0
     joltages = []
-    # for line in read_input(Path(__file__).parent / "test_input.txt"):
-    for line in read_input(Path(__file__).parent / "input.txt"):
-        j = get_largest_jolt(line.strip())
+    for bank in banks:
+        j = get_largest_jolt(bank, num_to_turn_on)
         joltage += j
         joltages.append(j)
 
     logger.info(f"Max joltage: {joltage}")
     logger.info(",".join(str(j) for j in joltages))
+    return joltage
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
+
+@engine("three.vectorised")
+def main_numpy(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from three.vectorised import parse, total_joltage
+
+    joltage = total_joltage(parse(input_path), NUM_TO_TURN_ON)
+    logger.info(f"Max joltage: {joltage}")
+    return joltage
+
+
+@engine("three.stream")
+def main_stream(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from three.stream import total_joltage
+
+    joltage = total_joltage(input_path, NUM_TO_TURN_ON)
+    logger.info(f"Max joltage: {joltage}")
+    return joltage
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"numpy": main_numpy, "stream": main_stream}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
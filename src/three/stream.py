@@ -0,0 +1,96 @@
+"""
+Day three for banks too long to hold in memory. A bank is read in fixed
+size chunks, twice: once to find where it ends, then again to pick its
+batteries. Knowing how many batteries are still to come is what lets the
+picks stay at K digits, so memory is the picks plus one chunk however long
+the bank is.
+"""
+
+from logging import getLogger
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+logger = getLogger(__name__)
+
+CHUNK_SIZE = 1 << 20
+
+
+def find_bank_end(f: BinaryIO, chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    """
+    Read on from the current position to the end of the bank, returning
+    (batteries in the bank, bytes up to and including its line ending)
+    """
+    consumed = 0
+    last = b""
+    while chunk := f.read(chunk_size):
+        idx = chunk.find(b"\n")
+        if idx != -1:
+            consumed += idx + 1
+            before = chunk[idx - 1 : idx] if idx else last
+            return consumed - 1 - (before == b"\r"), consumed
+        consumed += len(chunk)
+        last = chunk[-1:]
+
+    return consumed - (last == b"\r"), consumed
+
+
+def pick_batteries(
+    f: BinaryIO, length: int, num_to_turn_on: int, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Pick the largest num_to_turn_on digit joltage from the next length
+    batteries. A battery knocks smaller picks off the end while the
+    batteries still to come can refill their places, and is only picked if
+    there's room, so no more than num_to_turn_on digits are ever held.
+    """
+    if length < num_to_turn_on:
+        raise ValueError(
+            f"Can't turn on {num_to_turn_on} batteries in a bank of {length}"
+        )
+
+    picked = bytearray()
+    remaining = length
+    while remaining:
+        chunk = f.read(min(chunk_size, remaining))
+        if not chunk:
+            raise ValueError("The bank ended early")
+        for battery in chunk:
+            # remaining counts this battery too
+            while (
+                picked
+                and picked[-1] < battery
+                and len(picked) - 1 + remaining >= num_to_turn_on
+            ):
+                picked.pop()
+            if len(picked) < num_to_turn_on:
+                picked.append(battery)
+            remaining -= 1
+
+    return int(picked)
+
+
+def largest_joltages(
+    input_path: Path | str, num_to_turn_on: int, chunk_size: int = CHUNK_SIZE
+) -> Iterator[int]:
+    """
+    The largest joltage of each bank in the input, in order
+    """
+    with open(input_path, "rb") as f:
+        while True:
+            start = f.tell()
+            length, consumed = find_bank_end(f, chunk_size)
+            if not consumed:
+                return
+
+            if length:
+                logger.debug("Bank of %s batteries at byte %s", length, start)
+                f.seek(start)
+                yield pick_batteries(f, length, num_to_turn_on, chunk_size)
+            # Blank lines have no batteries, skip straight past them
+            f.seek(start + consumed)
+
+
+def total_joltage(
+    input_path: Path | str, num_to_turn_on: int, chunk_size: int = CHUNK_SIZE
+) -> int:
+    return sum(largest_joltages(input_path, num_to_turn_on, chunk_size))
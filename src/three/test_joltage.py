@@ -0,0 +1,43 @@
+from itertools import combinations
+from pathlib import Path
+from random import Random
+
+from three.solution_two import get_largest_jolt
+from three.stream import largest_joltages
+from util.logging import configure_logging
+
+
+def test_matches_every_choice():
+    rng = Random(3)
+    for _ in range(200):
+        bank = "".join(rng.choices("123456789", k=rng.randint(1, 10)))
+        for num_to_turn_on in range(1, len(bank) + 1):
+            best = max(
+                int("".join(picked)) for picked in combinations(bank, num_to_turn_on)
+            )
+            assert get_largest_jolt(bank, num_to_turn_on) == best
+
+
+def test_stream_matches_whole_banks(tmp_path: Path):
+    rng = Random(4)
+    banks = [
+        "".join(rng.choices("123456789", k=rng.randint(12, 80))) for _ in range(20)
+    ]
+    path = tmp_path / "banks.txt"
+    # Blank lines and CRLF endings shouldn't upset the chunking
+    path.write_bytes(("\r\n".join(banks) + "\r\n\n").encode())
+
+    # Chunks much shorter than a bank, so every bank spans several
+    for chunk_size in [1, 3, 5, 64]:
+        assert list(largest_joltages(path, 12, chunk_size)) == [
+            get_largest_jolt(bank) for bank in banks
+        ]
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    test_matches_every_choice()
+    with TemporaryDirectory() as tmp:
+        test_stream_matches_whole_banks(Path(tmp))
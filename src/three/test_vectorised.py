@@ -0,0 +1,28 @@
+from pathlib import Path
+from random import Random
+
+from three.solution_two import get_largest_jolt
+from three.vectorised import largest_joltages, parse
+from util.generate import battery_banks
+from util.logging import configure_logging
+
+
+def test_matches_one_bank_at_a_time(tmp_path: Path):
+    path = tmp_path / "banks.txt"
+    with open(path, "w") as out:
+        battery_banks(out, 50, Random(4), width=40)
+    banks = path.read_text().split()
+
+    grid = parse(path)
+    for num_to_turn_on in [1, 2, 12, 25, 40]:
+        assert largest_joltages(grid, num_to_turn_on).tolist() == [
+            get_largest_jolt(bank, num_to_turn_on) for bank in banks
+        ]
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    with TemporaryDirectory() as tmp:
+        test_matches_one_bank_at_a_time(Path(tmp))
@@ -0,0 +1,66 @@
+"""
+Day three over every bank at once. The banks are all the same length, so
+the input is a grid of digits, and each battery turned on is one argmax
+across every row. Needs numpy, which is an optional dependency, so nothing
+imports this module until its engine is asked for.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from util.input import grid_shape, map_input
+
+# Past this many digits a joltage no longer fits in an int64
+MAX_INT64_DIGITS = 18
+
+
+def parse(input_path: Path | str) -> np.ndarray:
+    """
+    Read the banks straight from the input bytes into a rows x batteries
+    grid of uint8 digits
+    """
+    with map_input(input_path) as buffer:
+        rows, cols, stride = grid_shape(buffer)
+        data = np.frombuffer(buffer, dtype=np.uint8).copy()
+
+    # Give the last row its missing newline, if it hasn't got one
+    if len(data) < rows * stride:
+        data = np.append(data, np.full(rows * stride - len(data), ord("\n"), np.uint8))
+    grid = data[: rows * stride].reshape(rows, stride)[:, :cols]
+    return grid - np.uint8(ord("0"))
+
+
+def largest_joltages(grid: np.ndarray, num_to_turn_on: int) -> np.ndarray:
+    """
+    The largest joltage of every bank. Like the greedy pick one bank at a
+    time: each battery is the first largest digit after the last one
+    picked, leaving enough batteries behind it for the rest.
+    """
+    rows, cols = grid.shape
+    if rows == 0:
+        return np.zeros(0, dtype=np.int64)
+    if num_to_turn_on > cols:
+        raise ValueError(
+            f"Can't turn on {num_to_turn_on} batteries in a bank of {cols}"
+        )
+
+    columns = np.arange(cols)
+    # Shift every digit up one, so masked out batteries, at zero, always
+    # lose to a battery in the window
+    shifted = grid + np.uint8(1)
+    start = np.zeros(rows, dtype=np.intp)
+    dtype = np.int64 if num_to_turn_on <= MAX_INT64_DIGITS else object
+    joltages = np.zeros(rows, dtype=dtype)
+    for step in range(num_to_turn_on):
+        last = cols - num_to_turn_on + step
+        window = (columns >= start[:, None]) & (columns <= last)
+        picked = np.argmax(shifted * window, axis=1)
+        joltages = joltages * 10 + grid[np.arange(rows), picked].astype(dtype)
+        start = picked + 1
+
+    return joltages
+
+
+def total_joltage(grid: np.ndarray, num_to_turn_on: int) -> int:
+    return sum(largest_joltages(grid, num_to_turn_on).tolist())
@@ -0,0 +1,94 @@
+"""
+Day two without visiting every ID. An ID of L digits made of a block of d
+digits repeated is the block times a multiplier like 1001 or 10101, so the
+invalid IDs in a range are a run of consecutive blocks times a constant,
+and their sum is an arithmetic series. The work per range depends on how
+many digit lengths it spans, not how wide it is.
+"""
+
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+
+def repeat_multiplier(block_length: int, length: int) -> int:
+    """
+    The number that turns a block into the block repeated out to length
+    digits, e.g. 1001 for blocks of 3 repeated to 6 digits
+    """
+    return (10**length - 1) // (10**block_length - 1)
+
+
+def sum_repeats(lo: int, hi: int, block_length: int, length: int) -> int:
+    """
+    Sum every length digit number in [lo, hi] that is a block_length block
+    repeated
+    """
+    multiplier = repeat_multiplier(block_length, length)
+    first = max(10 ** (block_length - 1), -(-lo // multiplier))
+    last = min(10**block_length - 1, hi // multiplier)
+    if first > last:
+        return 0
+
+    return multiplier * (first + last) * (last - first + 1) // 2
+
+
+def prime_factors(n: int) -> list[int]:
+    factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        factors.append(n)
+
+    return factors
+
+
+def sum_repeated_twice(lo: int, hi: int, length: int) -> int:
+    """
+    Part one: IDs that are a block repeated exactly twice
+    """
+    if length % 2:
+        return 0
+    return sum_repeats(lo, hi, length // 2, length)
+
+
+def sum_repeated(lo: int, hi: int, length: int) -> int:
+    """
+    Part two: IDs that are a block repeated any number of times. Every such
+    ID repeats a block of length / p digits for some prime p dividing the
+    length, so the repeats of those blocks are summed with
+    inclusion-exclusion. IDs repeating blocks of length / p and length / q
+    are exactly the IDs repeating blocks of length / pq.
+    """
+    primes = prime_factors(length)
+    total = 0
+    for subset in range(1, 2 ** len(primes)):
+        chosen = [p for idx, p in enumerate(primes) if subset >> idx & 1]
+        divisor = 1
+        for p in chosen:
+            divisor *= p
+        sign = 1 if len(chosen) % 2 else -1
+        total += sign * sum_repeats(lo, hi, length // divisor, length)
+
+    return total
+
+
+def sum_invalid(ranges: list[tuple[int, int]], sum_for_length) -> int:
+    """
+    Sum the invalid IDs across ranges, which mustn't overlap, splitting each
+    range at the powers of ten so sum_for_length sees one length at a time
+    """
+    total = 0
+    for lo, hi in ranges:
+        for length in range(len(str(lo)), len(str(hi)) + 1):
+            total += sum_for_length(
+                max(lo, 10 ** (length - 1)), min(hi, 10**length - 1), length
+            )
+        logger.debug("%s-%s summed", lo, hi)
+
+    return total
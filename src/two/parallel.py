@@ -0,0 +1,57 @@
+"""
+Day two's ID scan spread over a process pool. Ranges are merged first, so
+no ID is scanned twice, then cut into pieces of about the same width, since
+a scan costs about the same per ID wherever the IDs are.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+import os
+from typing import Callable
+
+from two.solution_one import merge_ranges
+
+logger = getLogger(__name__)
+
+# Narrower than this and a piece isn't worth sending to another process
+MIN_SHARD_WIDTH = 10_000
+
+
+def shard(
+    ranges: list[tuple[int, int]], shards: int, min_width: int = MIN_SHARD_WIDTH
+) -> list[tuple[int, int]]:
+    """
+    Cut non-overlapping ranges into about shards pieces of equal width,
+    splitting a range across pieces where needed
+    """
+    total = sum(upper - lower + 1 for lower, upper in ranges)
+    width = max(min_width, -(-total // max(1, shards)))
+
+    pieces = []
+    for lower, upper in ranges:
+        while lower <= upper:
+            pieces.append((lower, min(upper, lower + width - 1)))
+            lower += width
+
+    return pieces
+
+
+def solve(
+    ranges: list[tuple[int, int]],
+    process_range: Callable[[tuple[int, int]], int],
+    workers: int | None = None,
+) -> int:
+    """
+    Sum process_range over the merged, sharded ranges. process_range has to
+    be a module-level function, so it can be sent to the workers.
+    """
+    workers = workers or os.cpu_count()
+    # A few pieces per worker, so one slow piece doesn't hold up the rest
+    pieces = shard(merge_ranges(ranges), workers * 4)
+    logger.info(f"Scanning {len(pieces)} pieces on {workers} workers")
+
+    if len(pieces) <= 1 or workers == 1:
+        return sum(process_range(piece) for piece in pieces)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(process_range, pieces))
@@ -1,15 +1,13 @@
-from functools import reduce
 from math import floor
-import operator
 from util.logging import configure_logging
 from logging import getLogger
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
 from pathlib import Path
 from util.input import read_input
+from util.modules import engine
 
 
 def sieve_for_even_counts(num: int):
@@ -49,24 +47,24 @@ def get_ranges_from_line(input: str):
     return numeric_tuples
 
 
-# Some values to try and optimise Result cache - where a number has ended up
-# at the end of it's assessment, to prevent calculating twice
-RESULT_CACHE = dict()
-FAKE_IDS = set()
+def merge_ranges(ranges: list[tuple[int, int]]):
+    """
+    Collapse overlapping and touching ranges, so no ID is in two ranges
+    """
+    merged = []
+    for lower, upper in sorted(ranges):
+        if merged and lower <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(upper, merged[-1][1]))
+        else:
+            merged.append((lower, upper))
 
-# A set of candidates, to collapse any overlapping ranges
-CANDIDATES = set()
+    return merged
 
-# All values, for debugging and stats calc
-ALL_VALUES = []
 
-
-# A cache checker
-def check_cache(num: int):
-    if num in RESULT_CACHE:
-        return RESULT_CACHE[num]
-    else:
-        return None
+# Turn on to keep every ID checked, for debugging and stats. Costs memory
+# for every ID in every range.
+TRACK_ALL_VALUES = False
+ALL_VALUES = []
 
 
 def simple_halfway_check(num: int):
@@ -75,51 +73,74 @@ def simple_halfway_check(num: int):
     return as_str[:midpoint] == as_str[midpoint:]
 
 
-def process_range(range: str):
-    initial = range[0]
+def process_range(range: tuple[int, int]):
+    """
+    Check every ID in the range, returning the sum of the invalid ones
+    """
     current = range[0]
-    fake_found: list[int] = []
+    fake_sum = 0
+    fake_count = 0
 
     # Iterate through the raw ranges
     while current <= range[1]:
-        # Append the value for tracking
-        ALL_VALUES.append(current)
-
-        # Check the cache for a result, potentially skipping the sieve if
-        # we've seen it before
-        cached_value = check_cache(current)
-        if cached_value is not None:
-            return cached_value
-
-        if (
-            sieve_for_even_counts(current) is False
-            or simple_halfway_check(current) is False
-        ):
-            RESULT_CACHE[current] = False
-        else:
-            RESULT_CACHE[current] = True
-            fake_found.append(current)
+        if TRACK_ALL_VALUES:
+            ALL_VALUES.append(current)
+
+        if sieve_for_even_counts(current) and simple_halfway_check(current):
+            fake_sum += current
+            fake_count += 1
+            logger.debug("%s is invalid", current)
 
         current += 1
 
-    logger.info(
-        f"{range[0]}-{range[1]} has {len(fake_found)} invalid IDs: {fake_found}"
-    )
-    for id in fake_found:
-        FAKE_IDS.add(id)
+    logger.info("%s-%s has %s invalid IDs", range[0], range[1], fake_count)
+    return fake_sum
 
 
-def main():
+def parse(input_path: Path | str):
     ranges = []
-    for line in read_input(Path(__file__).parent / "input.txt"):
+    for line in read_input(input_path):
         ranges.extend(get_ranges_from_line(line.strip()))
 
-    for range in ranges:
-        process_range(range)
+    return ranges
+
+
+def solve(ranges: list[tuple[int, int]]):
+    # Merged ranges are disjoint, so no ID is checked or counted twice
+    sum = 0
+    for range in merge_ranges(ranges):
+        sum += process_range(range)
 
-    sum = reduce(operator.add, FAKE_IDS, 0)
     logger.info(f"Adding up all the invalid IDs produces {sum}")
+    return sum
+
+
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
+
+
+@engine("two.arithmetic")
+def main_arithmetic(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from two.arithmetic import sum_repeated_twice, sum_invalid
+
+    sum = sum_invalid(merge_ranges(parse(input_path)), sum_repeated_twice)
+    logger.info(f"Adding up all the invalid IDs produces {sum}")
+    return sum
+
+
+@engine("two.parallel")
+def main_parallel(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from two.parallel import solve
+
+    sum = solve(parse(input_path), process_range)
+    logger.info(f"Adding up all the invalid IDs produces {sum}")
+    return sum
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"arithmetic": main_arithmetic, "parallel": main_parallel}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
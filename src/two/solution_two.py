@@ -1,17 +1,13 @@
-from functools import reduce
-from math import floor
-import operator
 import re
-from two.solution_one import get_ranges_from_line
+from two.solution_one import merge_ranges, parse
 from util.logging import configure_logging
+from util.modules import engine
 from logging import getLogger
 
-configure_logging()
-logger = getLogger()
+logger = getLogger(__name__)
 
 
 from pathlib import Path
-from util.input import read_input
 
 
 def check_number(num: int):
@@ -61,10 +57,26 @@ def check_number(num: int):
 
 REGEX_TEMPLATE = r"([0-9]+)"
 
+# Compiled backreference patterns by ID length, one per block length that
+# divides it. Only those block lengths can ever match the whole ID.
+PATTERNS: dict[int, list[re.Pattern]] = {}
 
-def check_number_with_backreferences(num: int):
-    as_str = str(num)
-    length = len(as_str)
+
+def get_patterns(length: int):
+    if length not in PATTERNS:
+        PATTERNS[length] = [
+            re.compile(
+                rf"^([0-9]{{{substr_length}}})"
+                + r"\1" * (length // substr_length - 1)
+                + "$"
+            )
+            for substr_length in range(1, length // 2 + 1)
+            if length % substr_length == 0
+        ]
+    return PATTERNS[length]
+
+
+def check_with_patterns(as_str: str):
     hash = {}
 
     # The cheapest thing to do it iterate over figures
@@ -77,80 +89,94 @@ def check_number_with_backreferences(num: int):
     if least_reoccurance == 1:
         return False
 
-    for substr_length in range(1, floor(length / 2) + 1):
-        recurrance = floor(length / substr_length)
-        pattern = (
-            r"^([0-9]{" + str(substr_length) + r"})" + (r"\1" * (recurrance - 1)) + "$"
-        )
-        subbed = re.sub(pattern, "", as_str)
-        if len(subbed) == 0:
-            return True
+    return any(pattern.match(as_str) for pattern in get_patterns(len(as_str)))
+
 
-    return False
+def check_with_rotation(as_str: str):
+    """
+    A string is a block repeated exactly when it turns up in itself doubled
+    somewhere other than the start or the middle, i.e. it equals one of its
+    own rotations. One substring search, and no regex at all.
+    """
+    return as_str in (as_str + as_str)[1:-1]
 
 
-# Some values to try and optimise Result cache - where a number has ended up
-# at the end of it's assessment, to prevent calculating twice
-RESULT_CACHE = dict()
-FAKE_IDS = []
+# How check_number_with_backreferences tests an ID: "patterns" matches the
+# precompiled table, "rotation" searches the doubled string
+CHECKS = {"patterns": check_with_patterns, "rotation": check_with_rotation}
+CHECK = "rotation"
 
-# A set of candidates, to collapse any overlapping ranges
-CANDIDATES = set()
 
-# All values, for debugging and stats calc
-ALL_VALUES = []
+def check_number_with_backreferences(num: int, check: str | None = None):
+    return CHECKS[check or CHECK](str(num))
 
 
-# A cache checker
-def check_cache(num: int):
-    if num in RESULT_CACHE:
-        return RESULT_CACHE[num]
-    else:
-        return None
+# Turn on to keep every ID checked, for debugging and stats. Costs memory
+# for every ID in every range.
+TRACK_ALL_VALUES = False
+ALL_VALUES = []
 
 
-def process_range(range: str):
+def process_range(range: tuple[int, int]):
+    """
+    Check every ID in the range, returning the sum of the invalid ones
+    """
     current = range[0]
-    fake_found: list[int] = []
+    fake_sum = 0
+    fake_count = 0
 
     # Iterate through the raw ranges
     while current <= range[1]:
-        # Append the value for tracking
-        ALL_VALUES.append(current)
+        if TRACK_ALL_VALUES:
+            ALL_VALUES.append(current)
 
-        # Check the cache for a result, potentially skipping the sieve if
-        # we've seen it before
-        cached_value = check_cache(current)
-        if cached_value is not None:
-            return cached_value
-
-        if check_number_with_backreferences(current) is False:
-            RESULT_CACHE[current] = False
-        else:
-            RESULT_CACHE[current] = True
-            fake_found.append(current)
+        if check_number_with_backreferences(current):
+            fake_sum += current
+            fake_count += 1
+            logger.debug("%s is invalid", current)
 
         current += 1
 
-    logger.info(
-        f"{range[0]}-{range[1]} has {len(fake_found)} invalid IDs: {fake_found}"
-    )
-    for id in fake_found:
-        FAKE_IDS.append(id)
+    logger.info("%s-%s has %s invalid IDs", range[0], range[1], fake_count)
+    return fake_sum
+
+
+def solve(ranges: list[tuple[int, int]]):
+    # Merged ranges are disjoint, so no ID is checked or counted twice
+    sum = 0
+    for range in merge_ranges(ranges):
+        sum += process_range(range)
+
+    logger.info(f"Adding up all the invalid IDs produces {sum}")
+    return sum
+
 
+def main(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    return solve(parse(input_path))
 
-def main():
-    ranges = []
-    for line in read_input(Path(__file__).parent / "test_input.txt"):
-    # for line in read_input(Path(__file__).parent / "input.txt"):
-        ranges.extend(get_ranges_from_line(line.strip()))
 
-    for range in ranges:
-        process_range(range)
+@engine("two.arithmetic")
+def main_arithmetic(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from two.arithmetic import sum_repeated, sum_invalid
 
-    sum = reduce(operator.add, FAKE_IDS, 0)
+    sum = sum_invalid(merge_ranges(parse(input_path)), sum_repeated)
     logger.info(f"Adding up all the invalid IDs produces {sum}")
+    return sum
+
+
+@engine("two.parallel")
+def main_parallel(input_path: Path | str = Path(__file__).parent / "input.txt"):
+    from two.parallel import solve
+
+    sum = solve(parse(input_path), process_range)
+    logger.info(f"Adding up all the invalid IDs produces {sum}")
+    return sum
+
+
+# Other ways of getting the same answer, picked with the runner's --engine
+ENGINES = {"arithmetic": main_arithmetic, "parallel": main_parallel}
 
 
 if __name__ == "__main__":
+    configure_logging()
     main()
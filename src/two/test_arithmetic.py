@@ -0,0 +1,49 @@
+from random import Random
+
+from two import solution_one, solution_two
+from two.arithmetic import sum_invalid, sum_repeated, sum_repeated_twice
+from two.solution_one import merge_ranges, sieve_for_even_counts, simple_halfway_check
+from two.solution_two import check_number_with_backreferences
+from util.logging import configure_logging
+
+
+def test_matches_brute_force():
+    rng = Random(5)
+    for _ in range(50):
+        ranges = []
+        for _ in range(rng.randint(1, 4)):
+            lower = rng.randint(1, 10 ** rng.randint(1, 7))
+            ranges.append((lower, lower + rng.randint(0, 5000)))
+        # Overlap some of them, which mustn't count any ID twice
+        lower, upper = rng.choice(ranges)
+        ranges.append((rng.randint(lower, upper), upper + rng.randint(0, 100)))
+        ids = {id for lower, upper in ranges for id in range(lower, upper + 1)}
+
+        part_one = sum(
+            id for id in ids if sieve_for_even_counts(id) and simple_halfway_check(id)
+        )
+        part_two = sum(id for id in ids if check_number_with_backreferences(id))
+        assert part_two == sum(
+            id for id in ids if check_number_with_backreferences(id, "patterns")
+        )
+        assert solution_one.solve(ranges) == part_one
+        assert solution_two.solve(ranges) == part_two
+        assert sum_invalid(merge_ranges(ranges), sum_repeated_twice) == part_one
+        assert sum_invalid(merge_ranges(ranges), sum_repeated) == part_two
+
+
+def test_wide_ranges():
+    # Every 12 digit ID, far too many to visit one at a time
+    ranges = [(10**11, 10**12 - 1)]
+
+    # Six digit blocks repeated twice: 100000100000 up to 999999999999
+    assert sum_invalid(ranges, sum_repeated_twice) == 1000001 * sum(range(10**5, 10**6))
+    # 111111111111 repeats blocks of every length dividing 12, but is only
+    # counted once
+    assert sum_invalid([(111111111111, 111111111111)], sum_repeated) == 111111111111
+
+
+if __name__ == "__main__":
+    configure_logging("DEBUG")
+    test_matches_brute_force()
+    test_wide_ranges()
@@ -0,0 +1,40 @@
+from random import Random
+
+from two import parallel, solution_one, solution_two
+from two.solution_one import merge_ranges
+from util.logging import configure_logging
+
+
+def test_shards_cover_every_id_once():
+    rng = Random(12)
+    for _ in range(50):
+        ranges = []
+        for _ in range(rng.randint(1, 6)):
+            lower = rng.randint(1, 10**6)
+            ranges.append((lower, lower + rng.randint(0, 3000)))
+        merged = merge_ranges(ranges)
+
+        total = sum(upper - lower + 1 for lower, upper in merged)
+        shards = rng.randint(1, 20)
+        pieces = parallel.shard(merged, shards, min_width=10)
+        # In order, with no overlaps, and none wider than its share
+        width = max(10, -(-total // shards))
+        assert all(0 <= upper - lower < width for lower, upper in pieces)
+        assert all(a[1] < b[0] for a, b in zip(pieces, pieces[1:]))
+        # Put back together they're exactly the ranges they were cut from
+        assert merge_ranges(pieces) == merged
+        assert sum(upper - lower + 1 for lower, upper in pieces) == total
+
+
+def test_solve_matches_serial():
+    ranges = [(1, 60_000), (95_000, 130_000), (998_000, 1_012_000), (50_000, 70_000)]
+    for solution in [solution_one, solution_two]:
+        assert parallel.solve(ranges, solution.process_range, workers=2) == (
+            solution.solve(ranges)
+        )
+
+
+if __name__ == "__main__":
+    configure_logging("DEBUG")
+    test_shards_cover_every_id_once()
+    test_solve_matches_serial()
@@ -0,0 +1,279 @@
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import json
+from logging import getLogger
+import os
+from pathlib import Path
+import platform
+from statistics import median, quantiles
+import subprocess
+import sys
+
+from util.generate import GENERATORS, generate_input, measure_input
+from util.runner import SRC_ROOT, Day, format_bytes, run_part, tabulate
+
+logger = getLogger(__name__)
+
+BENCHMARK_ROOT = SRC_ROOT.parent / ".benchmarks"
+SYNTHETIC_ROOT = BENCHMARK_ROOT / "inputs"
+DEFAULT_IMPORT_BUDGET = 0.05
+
+
+@dataclass
+class BenchmarkResult:
+    day: int
+    part: int
+    scale: int
+    input_path: str | None
+    answer: int | None = None
+    timings: list[float] = field(default_factory=list)
+    median: float | None = None
+    p95: float | None = None
+    peak_memory: int | None = None
+    error: str | None = None
+    skipped: bool = False
+    engine: str | None = None
+
+
+@dataclass
+class ImportResult:
+    module: str
+    seconds: float | None = None
+    budget: float = DEFAULT_IMPORT_BUDGET
+    error: str | None = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.error is not None or self.seconds > self.budget
+
+
+def measure_import_time(module_name: str, runs: int = 3) -> float:
+    """
+    Import a module in a fresh interpreter under -X importtime, returning
+    its cumulative import time in seconds. The best of a few runs is taken,
+    so the first run can warm the bytecode cache.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in [str(SRC_ROOT), env.get("PYTHONPATH")] if p
+    )
+    # __import__ rather than importlib.import_module, which bypasses the
+    # importtime instrumentation for the module itself. It also copes with
+    # the packages named after numbers.
+    command = [sys.executable, "-X", "importtime", "-c", f"__import__({module_name!r})"]
+
+    timings = []
+    for _ in range(runs):
+        proc = subprocess.run(command, capture_output=True, text=True, env=env)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = (p.strip() for p in line.split("|"))
+            if name == module_name:
+                timings.append(int(cumulative) / 1_000_000)
+
+    if not timings:
+        raise RuntimeError(f"No import time was reported for {module_name}")
+    return min(timings)
+
+
+def check_import_times(
+    days: list[Day], parts: list[int], budget: float = DEFAULT_IMPORT_BUDGET
+) -> list[ImportResult]:
+    results = []
+    for day in days:
+        for part in parts:
+            result = ImportResult(day.module_name(part), budget=budget)
+            try:
+                result.seconds = measure_import_time(result.module)
+            except RuntimeError as e:
+                result.error = str(e)
+            if result.over_budget:
+                logger.warning(f"Importing {result.module} is over budget")
+            results.append(result)
+
+    return results
+
+
+def scaled_input(day: Day, scale: int) -> Path | None:
+    """
+    Get the input for a day at the given scale, generating and caching a
+    synthetic one under .benchmarks/inputs if needed. The synthetic input
+    has scale times as many records as the real one, at the same width.
+    """
+    source = day.input_path("input")
+    if scale == 1:
+        return source
+    if day.number not in GENERATORS:
+        return None
+
+    dest = SYNTHETIC_ROOT / f"{day.package}_x{scale}.txt"
+    if not dest.exists() or dest.stat().st_mtime < source.stat().st_mtime:
+        size, width = measure_input(day.number, source)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        generate_input(day.number, dest, size * scale, width)
+
+    return dest
+
+
+def benchmark_part(
+    day: Day,
+    part: int,
+    input_path: Path,
+    scale: int,
+    repeats: int,
+    engine: str | None = None,
+) -> BenchmarkResult:
+    result = BenchmarkResult(day.number, part, scale, str(input_path))
+
+    # run_part measures memory in an untimed run of its own, which is only
+    # worth doing once
+    for repeat in range(repeats):
+        run = run_part(
+            day,
+            part,
+            input_path,
+            trace_memory=repeat == repeats - 1,
+            engine=engine,
+        )
+        if run.error is not None:
+            result.error = run.error
+            return result
+        result.answer = run.answer
+        result.engine = run.engine
+        result.timings.append(run.wall)
+        result.peak_memory = run.peak_memory
+
+    result.median = median(result.timings)
+    # Inclusive, so a handful of repeats can't give a p95 beyond the slowest
+    result.p95 = (
+        quantiles(result.timings, n=20, method="inclusive")[-1]
+        if len(result.timings) > 1
+        else result.timings[0]
+    )
+    return result
+
+
+def run_benchmarks(
+    days: list[Day],
+    parts: list[int],
+    scales: list[int],
+    repeats: int = 5,
+    budget: float = 5.0,
+    engine: str | None = None,
+) -> list[BenchmarkResult]:
+    """
+    Benchmark each day and part at increasing scales. Once a part's median
+    exceeds budget seconds the larger scales are skipped, since they would
+    only take longer.
+    """
+    results = []
+    for day in days:
+        for part in parts:
+            over_budget = False
+            for scale in sorted(scales):
+                input_path = scaled_input(day, scale)
+                if input_path is None or over_budget:
+                    results.append(
+                        BenchmarkResult(
+                            day.number,
+                            part,
+                            scale,
+                            str(input_path) if input_path is not None else None,
+                            skipped=True,
+                        )
+                    )
+                    continue
+
+                logger.info(f"Benchmarking day {day.number} part {part} x{scale}")
+                result = benchmark_part(day, part, input_path, scale, repeats, engine)
+                results.append(result)
+                over_budget = result.error is not None or result.median > budget
+
+    return results
+
+
+def save_results(
+    results: list[BenchmarkResult],
+    imports: list[ImportResult],
+    output: Path | None = None,
+) -> Path:
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = BENCHMARK_ROOT / f"{stamp}.json"
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": [asdict(r) for r in results],
+                "imports": [asdict(r) for r in imports],
+            },
+            f,
+            indent=2,
+        )
+
+    return output
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    with open(path) as f:
+        return [BenchmarkResult(**r) for r in json.load(f)["results"]]
+
+
+def format_imports(imports: list[ImportResult]) -> str:
+    headers = ["Module", "Import (ms)", "Budget (ms)", ""]
+    rows = [
+        [
+            r.module,
+            r.error if r.error is not None else f"{r.seconds * 1000:.2f}",
+            f"{r.budget * 1000:.0f}",
+            "OVER BUDGET" if r.over_budget else "",
+        ]
+        for r in imports
+    ]
+    return tabulate(headers, rows)
+
+
+def format_results(
+    results: list[BenchmarkResult], baseline: list[BenchmarkResult] | None = None
+) -> str:
+    # Engines are only compared against themselves
+    previous = {(r.day, r.part, r.scale, r.engine): r for r in baseline or []}
+    headers = ["Day", "Part", "Scale", "Median (ms)", "p95 (ms)", "Peak mem"]
+    if baseline is not None:
+        headers.append("vs baseline")
+
+    rows = []
+    for r in results:
+        part = f"{r.part} ({r.engine})" if r.engine is not None else str(r.part)
+        if r.skipped or r.error is not None:
+            row = [str(r.day), part, f"x{r.scale}"]
+            row.append("skipped" if r.skipped else r.error)
+            row.extend([""] * (len(headers) - len(row)))
+            rows.append(row)
+            continue
+
+        row = [
+            str(r.day),
+            part,
+            f"x{r.scale}",
+            f"{r.median * 1000:.2f}",
+            f"{r.p95 * 1000:.2f}",
+            format_bytes(r.peak_memory),
+        ]
+        if baseline is not None:
+            before = previous.get((r.day, r.part, r.scale, r.engine))
+            row.append(
+                f"{before.median / r.median:.2f}x"
+                if before is not None and before.median
+                else "-"
+            )
+        rows.append(row)
+
+    return tabulate(headers, rows)
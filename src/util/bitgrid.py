@@ -0,0 +1,114 @@
+"""
+Grids packed one bit per cell, each row a Python int with column 0 in its
+top bit. Where the list of characters a day would otherwise parse into
+costs tens of bytes a cell, a row here is its width in bits, and a whole
+row moves or combines in a few big-int operations.
+"""
+
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+
+logger = getLogger(__name__)
+
+
+def bit_table(char: str) -> bytes:
+    """
+    A bytes.translate table turning char into b"1" and everything else into
+    b"0", so a row of the grid can be read as a binary number
+    """
+    table = bytearray(b"0" * 256)
+    table[ord(char)] = ord("1")
+    return bytes(table)
+
+
+@dataclass
+class BitGrid:
+    rows: list[int]
+    width: int
+
+    @classmethod
+    def from_lines(cls, lines, char: str) -> "BitGrid":
+        """
+        Pack the cells holding char, from lines of str or anything bytes()
+        takes. Blank lines are skipped, and every row must be as wide as the
+        first.
+        """
+        table = bit_table(char)
+        rows = []
+        width = 0
+        for line in lines:
+            line = line.encode() if isinstance(line, str) else bytes(line)
+            line = line.rstrip(b"\r\n")
+            if not line:
+                continue
+            if not rows:
+                width = len(line)
+            elif len(line) != width:
+                raise ValueError(f"Row {len(rows)} is {len(line)} wide, not {width}")
+            rows.append(int(line.translate(table), 2))
+
+        return cls(rows, width)
+
+    @classmethod
+    def from_file(cls, input_path: Path | str, char: str) -> "BitGrid":
+        logger.info(f"Packing {input_path}")
+        with open(input_path, "rb") as f:
+            return cls.from_lines(f, char)
+
+    @property
+    def mask(self) -> int:
+        """
+        Every column of a row set
+        """
+        return (1 << self.width) - 1
+
+    def count(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def neighbour_planes(self, row_idx: int) -> list[int]:
+        """
+        The count of set neighbours of every cell in a row, as bit planes:
+        bit c of planes[i] is bit i of column c's count. Each of the eight
+        shifted neighbour rows is added in with a ripple carry across the
+        planes, which is four planes deep since a count is at most 8.
+        """
+        mask = self.mask
+        row = self.rows[row_idx]
+        above = self.rows[row_idx - 1] if row_idx else 0
+        below = self.rows[row_idx + 1] if row_idx + 1 < len(self.rows) else 0
+
+        planes = [0, 0, 0, 0]
+        neighbours = [
+            above << 1,
+            above,
+            above >> 1,
+            row << 1,
+            row >> 1,
+            below << 1,
+            below,
+            below >> 1,
+        ]
+        for addend in neighbours:
+            addend &= mask
+            for idx, plane in enumerate(planes):
+                if not addend:
+                    break
+                planes[idx] = plane ^ addend
+                addend &= plane
+
+        return planes
+
+    def fewer_neighbours(self, row_idx: int, limit: int) -> int:
+        """
+        The cells of a row with fewer than limit set neighbours, for limit a
+        power of two. A count is under it exactly when none of the planes
+        from limit's bit upwards are set.
+        """
+        if limit <= 0 or limit & (limit - 1):
+            raise ValueError(f"limit must be a power of two, not {limit}")
+
+        high = 0
+        for plane in self.neighbour_planes(row_idx)[limit.bit_length() - 1 :]:
+            high |= plane
+        return ~high & self.mask
@@ -0,0 +1,143 @@
+from hashlib import file_digest, sha256
+import json
+from logging import getLogger
+import os
+from pathlib import Path
+import pickle
+
+logger = getLogger(__name__)
+
+CACHE_ROOT = Path(__file__).parent.parent.parent / ".cache"
+UTIL_ROOT = Path(__file__).parent
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Answers are small and worth reading by eye, parsed inputs are arbitrary
+# Python objects
+FORMATS = {
+    "answers": (".json", json.dumps, json.loads),
+    "parsed": (".pickle", pickle.dumps, pickle.loads),
+}
+
+
+def input_digest(input_path: Path | str) -> str:
+    with open(input_path, "rb") as f:
+        return file_digest(f, "sha256").hexdigest()
+
+
+def source_digest(package_path: Path) -> str:
+    """
+    Hash the source of a day package along with util, which every day leans
+    on. Any edit to either invalidates the day's entries.
+    """
+    digest = sha256()
+    for path in sorted([*package_path.glob("*.py"), *UTIL_ROOT.glob("*.py")]):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(*parts) -> str:
+    return sha256(":".join(str(p) for p in parts).encode()).hexdigest()
+
+
+class Cache:
+    """
+    A content-addressed on-disk cache with least recently used eviction.
+    Entries are files named by key; reading an entry touches it, and once
+    the cache grows past max_bytes the stalest entries are removed.
+    """
+
+    root: Path
+    max_bytes: int
+
+    def __init__(self, root: Path = CACHE_ROOT, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def _path(self, kind: str, key: str) -> Path:
+        suffix, _, _ = FORMATS[kind]
+        return self.root / kind / f"{key}{suffix}"
+
+    def get(self, kind: str, key: str):
+        path = self._path(kind, key)
+        _, _, loads = FORMATS[kind]
+        try:
+            value = loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Bump the entry to most recently used
+        os.utime(path)
+        return value
+
+    def put(self, kind: str, key: str, value):
+        path = self._path(kind, key)
+        _, dumps, _ = FORMATS[kind]
+        data = dumps(value)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename, so a concurrent reader never sees half an entry
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data.encode() if isinstance(data, str) else data)
+        tmp.replace(path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.root.glob("*/*"):
+            if path.name.endswith(".tmp"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Another process evicted it between the glob and the stat
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            logger.debug(f"Evicting {path}")
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def answer_key(
+        self,
+        package_path: Path,
+        part: int,
+        input_path: Path,
+        engine: str | None = None,
+    ) -> str:
+        """
+        Engines should agree, but an answer is only cached under the engine
+        that produced it, so asking for an engine always runs it at least once
+        """
+        parts = [package_path.name, part, input_digest(input_path)]
+        if engine is not None:
+            parts.append(engine)
+        return cache_key(*parts, source_digest(package_path))
+
+    def parsed_key(self, package_path: Path, input_path: Path) -> str:
+        return cache_key(
+            package_path.name,
+            "parsed",
+            input_digest(input_path),
+            source_digest(package_path),
+        )
+
+    def parsed(self, package_path: Path, input_path: Path, parse):
+        """
+        Parse input_path with parse, or load the result of an earlier parse
+        of the same input by the same source.
+        """
+        key = self.parsed_key(package_path, input_path)
+        value = self.get("parsed", key)
+        if value is None:
+            value = parse(input_path)
+            self.put("parsed", key, value)
+        return value
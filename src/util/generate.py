@@ -0,0 +1,263 @@
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from random import Random
+from typing import Callable, TextIO
+
+from util.input import grid_shape, map_input, split_records
+
+logger = getLogger(__name__)
+
+DEFAULT_SEED = 2025
+
+
+def rotations(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day one: one dial rotation per line, e.g. L68
+    """
+    for _ in range(size):
+        out.write(f"{rng.choice('LR')}{rng.randint(1, 999)}\n")
+
+
+def id_ranges(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day two: comma separated ID ranges on a single line, e.g. 11-22,95-115,
+    """
+    for _ in range(size):
+        digits = rng.randint(1, 10)
+        lower = rng.randint(10 ** (digits - 1), 10**digits - 1)
+        upper = lower + rng.randint(0, 10 ** rng.randint(1, 5))
+        out.write(f"{lower}-{upper},")
+    out.write("\n")
+
+
+def battery_banks(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day three: one bank of battery joltages per line, digits 1-9
+    """
+    width = width or 100
+    for _ in range(size):
+        out.write("".join(rng.choices("123456789", k=width)))
+        out.write("\n")
+
+
+def roll_grid(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day four: a grid of paper rolls (@) and empty floor (.). Square unless a
+    width is given.
+    """
+    width = width or size
+    for _ in range(size):
+        out.write("".join(rng.choices("@.", weights=(2, 1), k=width)))
+        out.write("\n")
+
+
+def fresh_ranges(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day five: size fresh ID ranges, a blank line, then size ingredient IDs
+    """
+    for _ in range(size):
+        lower = rng.randint(1, 10**15)
+        out.write(f"{lower}-{lower + rng.randint(0, 10**12)}\n")
+    out.write("\n")
+    for _ in range(size):
+        out.write(f"{rng.randint(1, 10**15)}\n")
+
+
+def worksheet(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day six: size problems laid out in columns, four rows of numbers and a
+    row of operators. Each problem's numbers are aligned to one side of its
+    column, and problems are separated by a column of spaces.
+    """
+    rows = 4
+    # Rows are written one at a time, so replay the same random choices for
+    # every row rather than holding the whole worksheet in memory
+    state = rng.getstate()
+    for row in range(rows + 1):
+        rng.setstate(state)
+        cells = []
+        for _ in range(size):
+            column_width = rng.randint(1, 4)
+            align_right = rng.random() < 0.5
+            # One number always fills the column. Lengths only ever grow or
+            # shrink down a column, otherwise reading the digits top to
+            # bottom would find a gap
+            lengths = [column_width] + [
+                rng.randint(1, column_width) for _ in range(rows - 1)
+            ]
+            nums = sorted(
+                (str(rng.randint(10 ** (l - 1), 10**l - 1)) for l in lengths),
+                key=len,
+                reverse=rng.random() < 0.5,
+            )
+            operator = rng.choice("+*")
+            if row == rows:
+                cells.append(operator.ljust(column_width))
+            elif align_right:
+                cells.append(nums[row].rjust(column_width))
+            else:
+                cells.append(nums[row].ljust(column_width))
+        out.write(" ".join(cells))
+        out.write("\n")
+
+
+def tachyon_manifold(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day seven: a start row, then size rows where every other row carries
+    splitters. Splitters stay off the outer columns so beams never leave
+    the manifold, and like the real input never sit side by side, since
+    then what a beam between them does depends on which splits first.
+    """
+    width = width or size
+    out.write("." * (width // 2) + "S" + "." * (width - width // 2 - 1) + "\n")
+    for row in range(size):
+        if row % 2 == 0:
+            out.write("." * width + "\n")
+            continue
+        cells = ["."] * width
+        for idx in range(1, width - 1):
+            if cells[idx - 1] != "^" and rng.random() < 0.1:
+                cells[idx] = "^"
+        out.write("".join(cells) + "\n")
+
+
+def junction_coords(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day eight: one x,y,z junction box coordinate per line
+    """
+    for _ in range(size):
+        x, y, z = (rng.randint(0, 99999) for _ in range(3))
+        out.write(f"{x},{y},{z}\n")
+
+
+def rectilinear_polygon(
+    out: TextIO, size: int, rng: Random, width: int | None = None
+):
+    """
+    Day nine: the red tile corners of a simple rectilinear polygon, one x,y
+    per line in order around the shape. The shape is a staircase above a
+    midline joined to a staircase below it, so it never self-intersects.
+    """
+    steps = max(2, size // 4)
+    extent = max(100000, steps * 20)
+    midline = extent // 2
+
+    xs = sorted(rng.sample(range(extent), steps + 1))
+    upper = [rng.randint(midline + 1, extent) for _ in range(steps)]
+    lower = [rng.randint(0, midline - 1) for _ in range(steps)]
+
+    # Walk the top edge left to right...
+    for idx in range(steps):
+        out.write(f"{xs[idx]},{upper[idx]}\n")
+        out.write(f"{xs[idx + 1]},{upper[idx]}\n")
+    # ...then the bottom edge right to left, back to where we started
+    for idx in reversed(range(steps)):
+        out.write(f"{xs[idx + 1]},{lower[idx]}\n")
+        out.write(f"{xs[idx]},{lower[idx]}\n")
+
+
+def machine_specs(out: TextIO, size: int, rng: Random, width: int | None = None):
+    """
+    Day ten: one machine per line. Targets and joltages are built from real
+    button presses, so every machine has a solution.
+    """
+    for _ in range(size):
+        lights = rng.randint(3, 10)
+        buttons = [
+            sorted(rng.sample(range(lights), rng.randint(1, lights)))
+            for _ in range(rng.randint(2, lights + 3))
+        ]
+
+        target = [0] * lights
+        for button in buttons:
+            if rng.random() < 0.5:
+                for light in button:
+                    target[light] ^= 1
+
+        joltages = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for light in button:
+                joltages[light] += presses
+
+        out.write("[" + "".join(".#"[t] for t in target) + "] ")
+        for button in buttons:
+            out.write("(" + ",".join(str(b) for b in button) + ") ")
+        out.write("{" + ",".join(str(j) for j in joltages) + "}\n")
+
+
+def _count_lines(buffer) -> tuple[int, int | None]:
+    return sum(1 for _ in split_records(buffer)), None
+
+
+def _count_ranges(buffer) -> tuple[int, int | None]:
+    return sum(1 for r in split_records(buffer, b",") if bytes(r).strip()), None
+
+
+def _line_width(buffer) -> tuple[int, int | None]:
+    records = list(split_records(buffer))
+    return len(records), len(records[0])
+
+
+def _grid(buffer) -> tuple[int, int | None]:
+    rows, cols, _ = grid_shape(buffer)
+    return rows, cols
+
+
+def _count_fresh_ranges(buffer) -> tuple[int, int | None]:
+    ranges_end = buffer.find(b"\n\n")
+    return bytes(buffer[:ranges_end]).count(b"\n") + 1, None
+
+
+def _count_problems(buffer) -> tuple[int, int | None]:
+    *_, operators = split_records(buffer)
+    return len(bytes(operators).split()), None
+
+
+def _manifold(buffer) -> tuple[int, int | None]:
+    rows, cols, _ = grid_shape(buffer)
+    return rows - 1, cols
+
+
+@dataclass
+class Generator:
+    # Write size records of input to out
+    write: Callable[[TextIO, int, Random, int | None], None]
+    # Work out (size, width) of an existing input, so it can be scaled
+    measure: Callable[[bytes], tuple[int, int | None]]
+
+
+GENERATORS = {
+    1: Generator(rotations, _count_lines),
+    2: Generator(id_ranges, _count_ranges),
+    3: Generator(battery_banks, _line_width),
+    4: Generator(roll_grid, _grid),
+    5: Generator(fresh_ranges, _count_fresh_ranges),
+    6: Generator(worksheet, _count_problems),
+    7: Generator(tachyon_manifold, _manifold),
+    8: Generator(junction_coords, _count_lines),
+    9: Generator(rectilinear_polygon, _count_lines),
+    10: Generator(machine_specs, _count_lines),
+}
+
+
+def measure_input(day: int, input_path: Path | str) -> tuple[int, int | None]:
+    with map_input(input_path) as buffer:
+        return GENERATORS[day].measure(buffer)
+
+
+def generate_input(
+    day: int,
+    output: Path | str,
+    size: int,
+    width: int | None = None,
+    seed: int = DEFAULT_SEED,
+):
+    """
+    Stream a synthetic input for a day straight to disk. The same seed,
+    size and width always produce the same file.
+    """
+    logger.info(f"Generating day {day} input of size {size} to {output}")
+    with open(output, "w", buffering=1 << 20) as out:
+        GENERATORS[day].write(out, size, Random(seed), width)
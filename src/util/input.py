@@ -1,4 +1,7 @@
+from contextlib import contextmanager
 from logging import getLogger
+from mmap import ACCESS_READ, mmap
+import os
 from pathlib import Path
 
 logger = getLogger(__name__)
@@ -9,3 +12,103 @@ def read_input(input_path: Path | str):
     with open(input_path) as f:
         for line in f:
             yield line
+
+
+@contextmanager
+def map_input(input_path: Path | str):
+    """
+    Memory-map an input file read-only. The mapping supports find() and the
+    buffer protocol, so views over it can be taken without copying. Empty
+    files can't be mapped, so they are handed back as an empty bytes.
+    """
+    logger.info(f"Mapping {input_path}")
+    with open(input_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+
+        buffer = mmap(f.fileno(), 0, access=ACCESS_READ)
+        try:
+            yield buffer
+        finally:
+            try:
+                buffer.close()
+            except BufferError:
+                # Somebody is still holding a view over the mapping. It will
+                # be unmapped once the last view is garbage collected.
+                logger.debug(f"Leaving {input_path} mapped, views are still held")
+
+
+def split_records(
+    buffer,
+    delimiter: bytes = b"\n",
+    keep_empty: bool = False,
+    start: int = 0,
+    end: int | None = None,
+):
+    """
+    Yield memoryview slices of buffer between delimiters, without copying.
+    buffer must support find(), e.g. bytes, bytearray or an mmap. A trailing
+    delimiter doesn't produce a final empty record. start and end limit the
+    split to that byte range of buffer.
+    """
+    # An empty delimiter is found wherever the search starts, so the split
+    # would never move on
+    if not delimiter:
+        raise ValueError("The delimiter can't be empty")
+
+    view = memoryview(buffer)
+    end = len(view) if end is None else end
+    step = len(delimiter)
+    while start < end:
+        idx = buffer.find(delimiter, start, end)
+        if idx == -1:
+            idx = end
+        if keep_empty or idx > start:
+            yield view[start:idx]
+        start = idx + step
+
+
+def read_input_records(input_path: Path | str, delimiter: bytes = b"\n"):
+    """
+    The bytes equivalent of read_input. Records are memoryviews into the
+    mapped file, so they are only valid while iterating; call bytes() on any
+    record that needs to outlive the loop.
+    """
+    with map_input(input_path) as buffer:
+        yield from split_records(buffer, delimiter)
+
+
+def grid_shape(buffer) -> tuple[int, int, int]:
+    """
+    Work out (rows, cols, stride) of a newline separated grid held in buffer,
+    so cell (row, col) lives at buffer[row * stride + col]. Every row must be
+    the same width; a missing final newline is tolerated.
+    """
+    cols = buffer.find(b"\n")
+    if cols == -1:
+        return (1 if len(buffer) else 0), len(buffer), len(buffer) + 1
+
+    # Allow for CRLF line endings, they just widen the stride
+    stride = cols + 1
+    if cols > 0 and buffer[cols - 1 : cols] == b"\r":
+        cols -= 1
+
+    rows, remainder = divmod(len(buffer), stride)
+    if remainder == cols:
+        rows += 1
+    elif remainder != 0:
+        raise ValueError("Grid rows are not all the same width")
+
+    # Ragged rows can still add up to the right length, so check that every
+    # newline is where a row of this width would end, with the same ending
+    ending = bytes(buffer[cols:stride])
+    expected = stride - 1
+    idx = buffer.find(b"\n")
+    while idx != -1:
+        if idx != expected or buffer[idx + 1 - len(ending) : idx + 1] != ending:
+            raise ValueError("Grid rows are not all the same width")
+        expected += stride
+        idx = buffer.find(b"\n", idx + 1)
+
+    return rows, cols, stride
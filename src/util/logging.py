@@ -1,5 +1,45 @@
-from logging import basicConfig
+import atexit
+from logging import BASIC_FORMAT, Formatter, StreamHandler, basicConfig, getLogger
 
 
-def configure_logging(loglevel="INFO"):
-    basicConfig(level=loglevel)
+def configure_logging(loglevel="INFO", background=False):
+    """
+    Configure the root logger, unless it has been configured already.
+
+    With background=True records are put on a queue and written out by a
+    listener thread, so a solver that logs heavily doesn't wait on stderr.
+    Hot loops should still log with %-style arguments rather than f-strings,
+    and guard anything expensive to build with logger.isEnabledFor, so that
+    disabled records cost next to nothing.
+    """
+    root = getLogger()
+    if root.handlers:
+        return
+
+    if not background:
+        basicConfig(level=loglevel)
+        return
+
+    # logging.handlers drags in socket and pickle, so only import it when
+    # it's going to be used
+    from logging.handlers import QueueHandler, QueueListener
+    from queue import SimpleQueue
+
+    handler = StreamHandler()
+    handler.setFormatter(Formatter(BASIC_FORMAT))
+    queue = SimpleQueue()
+    listener = QueueListener(queue, handler)
+    basicConfig(level=loglevel, handlers=[QueueHandler(queue)])
+    listener.start()
+    # Flush anything still queued on the way out
+    atexit.register(listener.stop)
+
+
+def configure_worker_logging(loglevel="INFO"):
+    """
+    Configure logging in a pool worker. A forked worker inherits the
+    parent's handlers, and with background logging that's a QueueHandler
+    feeding a queue nobody in the child reads, so they're replaced outright
+    with a plain stderr handler.
+    """
+    basicConfig(level=loglevel, force=True)
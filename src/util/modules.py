@@ -0,0 +1,35 @@
+"""
+Importing the modules of a day. Kept apart from the runner, and light on
+imports itself, since solutions import it too.
+"""
+
+from importlib import import_module
+
+
+def import_day_module(name: str):
+    """
+    Import a module of a day by its dotted name, e.g. "8.solution_one". The
+    later days' packages are named with digits, which aren't identifiers, so
+    they can't be named in a from import.
+    """
+    return import_module(name)
+
+
+def engine(module_name: str):
+    """
+    Mark an engine entry point with the module it imports when called.
+    Engines import lazily, since some need optional dependencies, and the
+    runner uses the mark to import the module before it starts timing.
+    """
+
+    def mark(func):
+        func.engine_module = module_name
+        return func
+
+    return mark
+
+
+def preload_engine(entry):
+    module_name = getattr(entry, "engine_module", None)
+    if module_name is not None:
+        import_day_module(module_name)
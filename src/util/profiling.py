@@ -0,0 +1,108 @@
+from collections import Counter
+from contextlib import contextmanager
+import cProfile
+from logging import getLogger
+from pathlib import Path
+import pstats
+import sys
+import threading
+
+logger = getLogger(__name__)
+
+
+@contextmanager
+def _cprofile(output: Path, sort_by: str = pstats.SortKey.CUMULATIVE):
+    """
+    Deterministic profiling. Accurate call counts and times, but every call
+    pays for it, so long runs get noticeably slower.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        with open(output, "w") as f:
+            pstats.Stats(profiler, stream=f).sort_stats(sort_by).print_stats()
+
+
+@contextmanager
+def _sample(output: Path, interval: float = 0.001):
+    """
+    Statistical profiling. A background thread looks at the profiled
+    thread's stack every interval seconds, so overhead stays low however long
+    the run. Stacks are written in the collapsed format flame graph tools
+    read, hottest first.
+    """
+    target = threading.get_ident()
+    stacks = Counter()
+    stop = threading.Event()
+
+    def sampler():
+        while not stop.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_qualname} ({Path(code.co_filename).name})")
+                frame = frame.f_back
+            stacks[";".join(reversed(stack))] += 1
+
+    thread = threading.Thread(target=sampler, name="profiling-sampler", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+        with open(output, "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def _counters(output: Path):
+    """
+    Count how many times each Python function starts, using sys.monitoring
+    so nothing but function entry is instrumented.
+    """
+    monitoring = sys.monitoring
+    tool = monitoring.PROFILER_ID
+    counts = Counter()
+
+    def on_start(code, offset):
+        counts[code] += 1
+
+    monitoring.use_tool_id(tool, "util.profiling")
+    monitoring.register_callback(tool, monitoring.events.PY_START, on_start)
+    monitoring.set_events(tool, monitoring.events.PY_START)
+    try:
+        yield
+    finally:
+        monitoring.set_events(tool, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(tool, monitoring.events.PY_START, None)
+        monitoring.free_tool_id(tool)
+        with open(output, "w") as f:
+            for code, count in counts.most_common():
+                f.write(
+                    f"{count:>12}  {code.co_qualname} "
+                    f"({code.co_filename}:{code.co_firstlineno})\n"
+                )
+
+
+PROFILERS = {"cprofile": _cprofile, "sample": _sample, "counters": _counters}
+
+
+@contextmanager
+def profile(mode: str, output: Path | str):
+    """
+    Profile the body of the with block, writing the report to output.
+    """
+    if mode not in PROFILERS:
+        raise ValueError(f"Unknown profile mode {mode!r}")
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Profiling with {mode}, writing to {output}")
+    with PROFILERS[mode](output):
+        yield
@@ -0,0 +1,530 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
+from logging import getLogger
+import os
+from pathlib import Path
+from time import perf_counter, process_time
+import tracemalloc
+
+from util.cache import Cache
+from util.logging import configure_worker_logging
+from util.modules import import_day_module, preload_engine
+from util.profiling import profile
+
+logger = getLogger(__name__)
+
+# Every day lives in its own package under src/. The early days were named
+# with words, the later ones with digits, so we map both onto day numbers.
+SRC_ROOT = Path(__file__).parent.parent
+DAY_NAMES = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+    "eleven": 11,
+    "twelve": 12,
+}
+PART_MODULES = {1: "solution_one", 2: "solution_two"}
+INPUT_FILES = {"input": "input.txt", "test": "test_input.txt"}
+PROFILE_ROOT = SRC_ROOT.parent / ".profiles"
+# Combined runs report the shared parse on a row of its own, as part 0
+PARSE_PART = 0
+
+
+@dataclass
+class Day:
+    number: int
+    package: str
+    path: Path
+
+    def input_path(self, choice: str | Path = "input") -> Path:
+        """
+        Resolve an input choice to a file. "input" and "test" are the files
+        shipped alongside the day, anything else is taken as a path.
+        """
+        if isinstance(choice, str) and choice in INPUT_FILES:
+            return self.path / INPUT_FILES[choice]
+        return Path(choice)
+
+    def input_paths(self, choice: str | Path = "input") -> list[Path]:
+        """
+        Like input_path, but "all" expands to every input shipped with the day.
+        """
+        if choice == "all":
+            return [self.input_path(c) for c in INPUT_FILES]
+        return [self.input_path(choice)]
+
+    def module_name(self, part: int) -> str:
+        return f"{self.package}.{PART_MODULES[part]}"
+
+    def load(self, part: int):
+        """
+        Import a part's module. Nothing is imported until a part is asked
+        for, and importing a part has no side effects beyond the import.
+        """
+        return import_day_module(self.module_name(part))
+
+
+@dataclass
+class PartResult:
+    day: int
+    part: int
+    input_path: Path
+    answer: int | None
+    wall: float
+    cpu: float
+    peak_memory: int | None
+    error: str | None = None
+    cached: bool = False
+    engine: str | None = None
+
+
+def parse_day(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+    if value in DAY_NAMES:
+        return DAY_NAMES[value]
+    raise ValueError(f"Unrecognised day {value!r}")
+
+
+def discover_days(root: Path = SRC_ROOT) -> dict[int, Day]:
+    """
+    Find every day package under root, without importing any of them.
+    """
+    days = {}
+    for path in root.iterdir():
+        if not (path / PART_MODULES[1]).with_suffix(".py").exists():
+            continue
+        try:
+            number = parse_day(path.name)
+        except ValueError:
+            logger.warning(f"Skipping {path}, it doesn't look like a day")
+            continue
+        days[number] = Day(number=number, package=path.name, path=path)
+
+    return dict(sorted(days.items()))
+
+
+def _cached_result(
+    day: Day, part: int, input_path: Path, cache: Cache, engine: str | None = None
+) -> PartResult | None:
+    wall_start = perf_counter()
+    cpu_start = cpu_time()
+    answer = cache.get("answers", cache.answer_key(day.path, part, input_path, engine))
+    if answer is None:
+        return None
+
+    return PartResult(
+        day.number,
+        part,
+        input_path,
+        answer,
+        perf_counter() - wall_start,
+        cpu_time() - cpu_start,
+        None,
+        cached=True,
+        engine=engine,
+    )
+
+
+def profile_path(
+    profile_dir: Path,
+    day: Day,
+    step: str,
+    input_path: Path,
+    engine: str | None,
+    profile_mode: str | None,
+) -> Path:
+    """
+    Where to write a profile. Every input and engine gets a file of its own,
+    so profiling several of them in one run doesn't overwrite any
+    """
+    name = f"{day.package}_{step}_{input_path.stem}_{engine or 'default'}"
+    return profile_dir / f"{name}_{profile_mode}.txt"
+
+
+def cpu_time() -> float:
+    """
+    CPU time used by this process and any child processes it has waited
+    for, so engines that hand work to a process pool are charged for it
+    """
+    times = os.times()
+    return process_time() + times.children_user + times.children_system
+
+
+def _timed_call(
+    func,
+    arg,
+    trace_memory: bool = True,
+    profile_mode: str | None = None,
+    profile_output: Path | None = None,
+):
+    """
+    Call func(arg), returning (result, wall, cpu, peak_memory, error).
+
+    tracemalloc slows allocation-heavy code down several times over, so the
+    peak memory comes from a second, untimed call rather than the timed one.
+    """
+    result = None
+    error = None
+    peak_memory = None
+
+    profiler = nullcontext()
+    if profile_mode is not None:
+        profiler = profile(profile_mode, profile_output)
+
+    wall_start = perf_counter()
+    cpu_start = cpu_time()
+    try:
+        with profiler:
+            result = func(arg)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        wall = perf_counter() - wall_start
+        cpu = cpu_time() - cpu_start
+
+    if trace_memory and error is None:
+        tracemalloc.start()
+        try:
+            func(arg)
+        except Exception as e:
+            logger.warning(f"Measuring peak memory failed: {type(e).__name__}: {e}")
+        finally:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    return result, wall, cpu, peak_memory, error
+
+
+def run_part(
+    day: Day,
+    part: int,
+    input_path: Path,
+    trace_memory: bool = True,
+    profile_mode: str | None = None,
+    profile_dir: Path = PROFILE_ROOT,
+    cache: Cache | None = None,
+    engine: str | None = None,
+) -> PartResult:
+    """
+    Import and run a single part in this process, timing the call to main().
+    Import time is deliberately excluded from the measurement. With a
+    profile_mode the call is also profiled, and the report is written to
+    profile_dir. With a cache, an answer already computed for the same
+    input and source is returned without running anything.
+
+    An engine picks one of the part's alternative entry points from its
+    ENGINES dict instead of main(). Parts without that engine run main().
+    """
+    try:
+        module = day.load(part)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        return PartResult(day.number, part, input_path, None, 0.0, 0.0, None, error)
+
+    entry = module.main
+    engines = getattr(module, "ENGINES", {})
+    if engine is not None and engine in engines:
+        entry = engines[engine]
+    elif engine is not None:
+        logger.info(f"Day {day.number} part {part} has no {engine} engine")
+        engine = None
+
+    # The engine has to be settled first, since answers are cached per engine
+    if cache is not None:
+        result = _cached_result(day, part, input_path, cache, engine)
+        if result is not None:
+            return result
+
+    # Engines import their modules when called, so import them now to keep
+    # that out of the timing, as it is for the part's own module
+    try:
+        preload_engine(entry)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        return PartResult(
+            day.number, part, input_path, None, 0.0, 0.0, None, error, engine=engine
+        )
+
+    output = profile_path(
+        profile_dir, day, PART_MODULES[part], input_path, engine, profile_mode
+    )
+    answer, wall, cpu, peak_memory, error = _timed_call(
+        entry, input_path, trace_memory, profile_mode, output
+    )
+
+    if cache is not None and error is None and answer is not None:
+        cache.put(
+            "answers", cache.answer_key(day.path, part, input_path, engine), answer
+        )
+
+    return PartResult(
+        day.number,
+        part,
+        input_path,
+        answer,
+        wall,
+        cpu,
+        peak_memory,
+        error,
+        engine=engine,
+    )
+
+
+def run_day_combined(
+    day: Day,
+    parts: list[int],
+    input_path: Path,
+    trace_memory: bool = True,
+    profile_mode: str | None = None,
+    profile_dir: Path = PROFILE_ROOT,
+    cache: Cache | None = None,
+) -> list[PartResult]:
+    """
+    Parse the input once and hand the result to every part's solve(),
+    rather than having each part's main() read and parse it again. The
+    parse gets a row of its own, with PARSE_PART as its part.
+
+    This only works when the parts share their parse function, so a day
+    whose parts parse differently falls back to run_part for each part.
+    """
+    results = {}
+    if cache is not None:
+        for part in parts:
+            result = _cached_result(day, part, input_path, cache)
+            if result is not None:
+                results[part] = result
+    to_solve = [part for part in parts if part not in results]
+    if not to_solve:
+        return [results[part] for part in parts]
+
+    try:
+        modules = {part: day.load(part) for part in to_solve}
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        return [
+            PartResult(day.number, part, input_path, None, 0.0, 0.0, None, error)
+            for part in parts
+        ]
+
+    parsers = {getattr(module, "parse", None) for module in modules.values()}
+    parse = parsers.pop()
+    if parsers or parse is None:
+        logger.info(f"Day {day.number}'s parts don't share a parse, running apart")
+        return [
+            results.get(part)
+            or run_part(
+                day, part, input_path, trace_memory, profile_mode, profile_dir, cache
+            )
+            for part in parts
+        ]
+
+    load = parse
+    if cache is not None:
+        load = partial(cache.parsed, day.path, parse=parse)
+
+    output = profile_path(profile_dir, day, "parse", input_path, None, profile_mode)
+    parsed, wall, cpu, peak_memory, error = _timed_call(
+        load, input_path, trace_memory, profile_mode, output
+    )
+    parse_result = PartResult(
+        day.number, PARSE_PART, input_path, None, wall, cpu, peak_memory, error
+    )
+
+    for part in to_solve:
+        if error is not None:
+            results[part] = PartResult(
+                day.number, part, input_path, None, 0.0, 0.0, None, "Parse failed"
+            )
+            continue
+
+        output = profile_path(
+            profile_dir, day, PART_MODULES[part], input_path, None, profile_mode
+        )
+        answer, wall, cpu, peak_memory, solve_error = _timed_call(
+            modules[part].solve, parsed, trace_memory, profile_mode, output
+        )
+        results[part] = PartResult(
+            day.number, part, input_path, answer, wall, cpu, peak_memory, solve_error
+        )
+        if cache is not None and solve_error is None and answer is not None:
+            cache.put("answers", cache.answer_key(day.path, part, input_path), answer)
+
+    return [parse_result, *(results[part] for part in parts)]
+
+
+def run_days(
+    days: list[Day],
+    parts: list[int],
+    input_choice: str | Path = "input",
+    trace_memory: bool = True,
+    profile_mode: str | None = None,
+    cache: Cache | None = None,
+    combined: bool = False,
+    engine: str | None = None,
+) -> list[PartResult]:
+    results = []
+    for day in days:
+        if combined:
+            for input_path in day.input_paths(input_choice):
+                logger.info(f"Running day {day.number} combined on {input_path}")
+                results.extend(
+                    run_day_combined(
+                        day,
+                        parts,
+                        input_path,
+                        trace_memory,
+                        profile_mode,
+                        cache=cache,
+                    )
+                )
+            continue
+
+        for part in parts:
+            for input_path in day.input_paths(input_choice):
+                logger.info(f"Running day {day.number} part {part} on {input_path}")
+                results.append(
+                    run_part(
+                        day,
+                        part,
+                        input_path,
+                        trace_memory,
+                        profile_mode,
+                        cache=cache,
+                        engine=engine,
+                    )
+                )
+
+    return results
+
+
+def run_days_parallel(
+    days: list[Day],
+    parts: list[int],
+    input_choice: str | Path = "input",
+    trace_memory: bool = True,
+    workers: int | None = None,
+    log_level: str = "WARNING",
+    profile_mode: str | None = None,
+    cache: Cache | None = None,
+    engine: str | None = None,
+) -> tuple[list[PartResult], float]:
+    """
+    Run every day, part and input on a process pool, returning the results
+    in the same order as run_days along with the wall time of the whole
+    run. Each part still runs in-process within its worker, so its timings
+    are comparable with a serial run.
+    """
+    tasks = [
+        (day, part, input_path)
+        for day in days
+        for part in parts
+        for input_path in day.input_paths(input_choice)
+    ]
+    results: list[PartResult | None] = [None] * len(tasks)
+
+    start = perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=configure_worker_logging,
+        initargs=(log_level,),
+    ) as pool:
+        futures = {
+            pool.submit(
+                run_part,
+                day,
+                part,
+                input_path,
+                trace_memory,
+                profile_mode,
+                cache=cache,
+                engine=engine,
+            ): idx
+            for idx, (day, part, input_path) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            logger.info(f"Day {result.day} part {result.part} finished")
+            results[futures[future]] = result
+
+    return results, perf_counter() - start
+
+
+def format_bytes(num: int | None):
+    if num is None:
+        return "-"
+    for unit in ["B", "KiB", "MiB"]:
+        if num < 1024:
+            return f"{num:.0f} {unit}" if unit == "B" else f"{num:.1f} {unit}"
+        num /= 1024
+    return f"{num:.1f} GiB"
+
+
+def tabulate(headers: list[str], rows: list[list[str]]) -> str:
+    widths = [max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(headers, widths)),
+        "  ".join("-" * width for width in widths),
+    ]
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+    return "\n".join(lines)
+
+
+def format_part(r: PartResult) -> str:
+    if r.part == PARSE_PART:
+        return "parse"
+    if r.engine is not None:
+        return f"{r.part} ({r.engine})"
+    return str(r.part)
+
+
+def format_answer(r: PartResult) -> str:
+    if r.error is not None:
+        return r.error
+    if r.part == PARSE_PART:
+        return "-"
+    if r.cached:
+        return f"{r.answer} (cached)"
+    return str(r.answer)
+
+
+def format_table(results: list[PartResult]) -> str:
+    headers = ["Day", "Part", "Input", "Answer", "Wall (ms)", "CPU (ms)", "Peak mem"]
+    rows = []
+    for r in results:
+        rows.append(
+            [
+                str(r.day),
+                format_part(r),
+                Path(r.input_path).name,
+                format_answer(r),
+                f"{r.wall * 1000:.1f}",
+                f"{r.cpu * 1000:.1f}",
+                format_bytes(r.peak_memory),
+            ]
+        )
+
+    rows.append(
+        [
+            "Total",
+            "",
+            "",
+            "",
+            f"{sum(r.wall for r in results) * 1000:.1f}",
+            f"{sum(r.cpu for r in results) * 1000:.1f}",
+            "",
+        ]
+    )
+
+    return tabulate(headers, rows)
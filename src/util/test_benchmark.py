@@ -0,0 +1,68 @@
+from pathlib import Path
+from statistics import median
+
+from util.benchmark import (
+    BenchmarkResult,
+    ImportResult,
+    benchmark_part,
+    check_import_times,
+    format_results,
+    load_results,
+    save_results,
+)
+from util.logging import configure_logging
+from util.runner import discover_days
+
+
+def test_benchmark_stats():
+    day = discover_days()[3]
+    result = benchmark_part(day, 1, day.input_path("test"), 1, repeats=5)
+
+    assert result.error is None
+    assert len(result.timings) == 5
+    assert result.median == median(result.timings)
+    assert result.median <= result.p95 <= max(result.timings)
+    # Memory is only measured once, in its own untimed run
+    assert result.peak_memory is not None
+
+
+def test_import_budget():
+    day = discover_days()[3]
+    within, over = (
+        check_import_times([day], [1], budget=budget)[0] for budget in (10.0, 0.0)
+    )
+    assert within.error is None and not within.over_budget
+    assert over.seconds > 0 and over.over_budget
+    assert ImportResult("missing", error="No module named 'missing'").over_budget
+
+
+def test_compare_with_baseline(tmp_path: Path):
+    baseline = [
+        BenchmarkResult(1, 1, 1, None, median=1.0, p95=1.0),
+        BenchmarkResult(1, 1, 1, None, median=4.0, p95=4.0, engine="numpy"),
+    ]
+    path = save_results(baseline, [], tmp_path / "baseline.json")
+    assert load_results(path) == baseline
+
+    results = [
+        BenchmarkResult(1, 1, 1, "input.txt", median=0.5, p95=0.5, engine="numpy"),
+        BenchmarkResult(1, 2, 1, "input.txt", median=0.5, p95=0.5),
+        BenchmarkResult(1, 2, 2, None, skipped=True),
+    ]
+    rows = format_results(results, load_results(path)).splitlines()
+    assert "vs baseline" in rows[0]
+    # Compared against the same engine's baseline, not the default one
+    numpy, unmatched, skipped = rows[-3:]
+    assert numpy.rstrip().endswith("8.00x")
+    assert unmatched.rstrip().endswith("-")
+    assert "skipped" in skipped
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    test_benchmark_stats()
+    test_import_budget()
+    with TemporaryDirectory() as tmp:
+        test_compare_with_baseline(Path(tmp))
@@ -0,0 +1,111 @@
+import os
+from pathlib import Path
+
+from util.cache import Cache
+from util.logging import configure_logging
+
+
+def make_day(tmp_path: Path) -> tuple[Path, Path]:
+    package = tmp_path / "three"
+    package.mkdir()
+    (package / "solution_one.py").write_text("def solve(x):\n    return x\n")
+    input_path = package / "input.txt"
+    input_path.write_text("12345\n")
+    return package, input_path
+
+
+def test_answer_keys(tmp_path: Path):
+    cache = Cache(tmp_path / "cache")
+    package, input_path = make_day(tmp_path)
+    key = cache.answer_key(package, 1, input_path)
+
+    assert cache.answer_key(package, 1, input_path) == key
+    others = {
+        cache.answer_key(package, 2, input_path),
+        cache.answer_key(package, 1, input_path, "numpy"),
+        cache.answer_key(package, 1, input_path, "stream"),
+    }
+    # Editing the input or the day's source both invalidate the answer
+    input_path.write_text("54321\n")
+    others.add(cache.answer_key(package, 1, input_path))
+    (package / "solution_one.py").write_text("def solve(x):\n    return -x\n")
+    others.add(cache.answer_key(package, 1, input_path))
+    renamed = package.rename(tmp_path / "four")
+    others.add(cache.answer_key(renamed, 1, renamed / "input.txt"))
+
+    assert len(others) == 6 and key not in others
+
+
+def test_evicts_least_recently_used(tmp_path: Path):
+    cache = Cache(tmp_path)
+    for idx, key in enumerate("abc"):
+        cache.put("answers", key, 100 + idx)
+        # Space the entries out in time, oldest first
+        os.utime(cache._path("answers", key), (idx, idx))
+    assert cache.get("answers", "a") == 100
+
+    # Each entry is 3 bytes, so room for two. Reading a made it the most
+    # recently used, leaving b the stalest
+    cache.max_bytes = 6
+    cache.evict()
+    assert cache.get("answers", "b") is None
+    assert cache.get("answers", "a") == 100
+    assert cache.get("answers", "c") == 102
+
+
+def test_evict_skips_entries_already_gone(tmp_path: Path):
+    cache = Cache(tmp_path)
+    for key in "abc":
+        cache.put("answers", key, 1)
+
+    # Another process removes every entry just before it's looked at
+    stat = Path.stat
+
+    def vanishing_stat(path, *args, **kwargs):
+        if path.parent.name == "answers":
+            os.unlink(path)
+        return stat(path, *args, **kwargs)
+
+    Path.stat = vanishing_stat
+    try:
+        cache.max_bytes = 0
+        cache.evict()
+    finally:
+        Path.stat = stat
+    assert not any((tmp_path / "answers").iterdir())
+
+
+def test_corrupt_entry_is_recomputed(tmp_path: Path):
+    cache = Cache(tmp_path / "cache")
+    package, input_path = make_day(tmp_path)
+    calls = []
+
+    def parse(path):
+        calls.append(path)
+        return [1, 2, 3]
+
+    assert cache.parsed(package, input_path, parse) == [1, 2, 3]
+    assert cache.parsed(package, input_path, parse) == [1, 2, 3]
+    assert len(calls) == 1
+
+    entry = cache._path("parsed", cache.parsed_key(package, input_path))
+    entry.write_bytes(b"not a pickle")
+    assert cache.parsed(package, input_path, parse) == [1, 2, 3]
+    assert len(calls) == 2
+    # And the entry was written again, good this time
+    assert cache.parsed(package, input_path, parse) == [1, 2, 3]
+    assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    for test in [
+        test_answer_keys,
+        test_evicts_least_recently_used,
+        test_evict_skips_entries_already_gone,
+        test_corrupt_entry_is_recomputed,
+    ]:
+        with TemporaryDirectory() as tmp:
+            test(Path(tmp))
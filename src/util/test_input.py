@@ -0,0 +1,51 @@
+from util.input import grid_shape, split_records
+from util.logging import configure_logging
+
+
+def raises_value_error(func, *args) -> bool:
+    try:
+        func(*args)
+    except ValueError:
+        return True
+    return False
+
+
+def test_split_records():
+    buffer = b"a,,bc,d,"
+    assert [bytes(r) for r in split_records(buffer, b",")] == [b"a", b"bc", b"d"]
+    assert [bytes(r) for r in split_records(buffer, b",", keep_empty=True)] == [
+        b"a",
+        b"",
+        b"bc",
+        b"d",
+    ]
+    assert [bytes(r) for r in split_records(buffer, b",", start=2, end=6)] == [b"bc"]
+
+    # The split is lazy, so the error comes with the first record
+    assert raises_value_error(next, split_records(buffer, b""))
+
+
+def test_grid_shape():
+    assert grid_shape(b"") == (0, 0, 1)
+    assert grid_shape(b"abc") == (1, 3, 4)
+    assert grid_shape(b"ab\ncd\n") == (2, 2, 3)
+    # A missing final newline, and CRLF endings
+    assert grid_shape(b"ab\ncd") == (2, 2, 3)
+    assert grid_shape(b"ab\r\ncd\r\n") == (2, 2, 4)
+    assert grid_shape(b"ab\r\ncd") == (2, 2, 4)
+
+    assert raises_value_error(grid_shape, b"ab\ncde\n")
+
+
+def test_grid_shape_ragged_rows_that_fit():
+    # Each of these adds up to a whole number of rows of the first row's
+    # width, so only where the line endings fall gives them away
+    for ragged in [b"ab\ncde\nf\n", b"ab\n\nb\n", b"ab\r\ncd\nx\n", b"abc\nabcdefg\n"]:
+        assert raises_value_error(grid_shape, ragged)
+
+
+if __name__ == "__main__":
+    configure_logging("DEBUG")
+    test_split_records()
+    test_grid_shape()
+    test_grid_shape_ragged_rows_that_fit()
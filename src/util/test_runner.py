@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from util.logging import configure_logging
+from util.runner import discover_days, run_days, run_days_parallel, run_part
+
+
+def test_profiles_per_input(tmp_path: Path):
+    day = discover_days()[3]
+    for input_path in day.input_paths("all"):
+        result = run_part(
+            day,
+            1,
+            input_path,
+            trace_memory=False,
+            profile_mode="cprofile",
+            profile_dir=tmp_path,
+        )
+        assert result.error is None
+
+    # One report each, rather than the second overwriting the first
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "three_solution_one_input_default_cprofile.txt",
+        "three_solution_one_test_input_default_cprofile.txt",
+    ]
+
+
+def test_parallel_matches_serial():
+    days = [discover_days()[1], discover_days()[3]]
+    serial = run_days(days, [1, 2], "all", trace_memory=False)
+    parallel, _ = run_days_parallel(days, [1, 2], "all", trace_memory=False, workers=2)
+
+    def answers(results):
+        return [(r.day, r.part, r.input_path, r.answer, r.error) for r in results]
+
+    assert len(serial) == 8
+    assert answers(parallel) == answers(serial)
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    configure_logging("DEBUG")
+    test_parallel_matches_serial()
+    with TemporaryDirectory() as tmp:
+        test_profiles_per_input(Path(tmp))